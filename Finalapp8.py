@@ -14,23 +14,238 @@ except ImportError:
 # 📚 Import all the tools we need to make our app work
 import streamlit as st           # Makes beautiful web apps (like the one you're using!)
 import chromadb                  # Stores documents in a smart way so we can search them fast
-from transformers import pipeline # The AI brain that answers questions
+from transformers import pipeline, AutoConfig, AutoTokenizer # The AI brain that answers questions
 from pathlib import Path         # Helps us work with file paths (like addresses for files)
-import tempfile                  # Creates temporary files that disappear when we're done
 from datetime import datetime    # Tells us what time and date it is
-import time                      # Helps us add pauses and delays
+import time                      # A stopwatch, so we don't update the screen too often
+import numpy as np               # Does fast math on big lists of numbers
+import torch                     # The engine that runs the AI brains (and knows about GPUs)
+import importlib.util            # Checks if optional helper packages are installed
+import hashlib                   # Makes "fingerprints" of files so we can spot repeats
+import pickle                    # Saves Python things to disk and loads them back
+from io import BytesIO           # Lets bytes in memory pretend to be a file
+import charset_normalizer        # Guesses which "alphabet" (encoding) a text file uses
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed  # Hands out work to the helpers
+from itertools import islice       # Takes a handful of items at a time from a long line
+from collections import Counter  # Counts how many of each thing we have
+import platform                  # Tells us what kind of computer and Python we're running on
+from styles import inject_styles  # Puts our shared CSS (from static/) on the page
+try:
+    import psutil                # Measures memory and CPU use (optional extra)
+except ImportError:
+    psutil = None                # No psutil? We just skip the resource numbers
+
+
+@st.cache_resource(show_spinner=False)
+def start_cpu_stopwatch():
+    """
+    ⏱️ THE CPU STOPWATCH STARTER!
+    
+    What this function does (in simple words):
+    - Starts psutil's CPU stopwatch ONE time per app process
+    - Streamlit runs this whole file again on every click, so starting it up here at the
+      top would reset the stopwatch every time - @st.cache_resource makes it happen once
+    """
+    if psutil is not None:
+        psutil.cpu_percent(interval=None)
+
+
+@st.cache_resource(show_spinner=False)
+def get_platform_info() -> tuple:
+    """🖥️ Computer facts that never change while the app runs - looked up once per app process"""
+    return (platform.system(), platform.release(), platform.python_version())
+
+
+start_cpu_stopwatch()
+PLATFORM_INFO = get_platform_info()
 
 #  Import tools for converting documents (turning PDFs into text we can read)
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
-from docling.datamodel.base_models import InputFormat
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, DocumentStream
 from docling.datamodel.pipeline_options import PdfPipelineOptions, AcceleratorOptions, AcceleratorDevice
 
 # 🧠 Import tools for making text smart and searchable
 from langchain.text_splitter import RecursiveCharacterTextSplitter  # Cuts text into smart pieces
 from sentence_transformers import SentenceTransformer              # Understands what text means
+from sentence_transformers.models import StaticEmbedding           # A super fast (but simpler) way to understand text
+
+# ⚡ Static (Model2Vec) embeddings are hundreds of times faster on a CPU, but a bit less accurate.
+# Turn this on for huge documents on slow computers (needs `pip install model2vec`).
+USE_STATIC_EMBEDDINGS = False
+
+# 🧠 The brain that turns text into numbers so we can compare meanings
+EMBEDDING_MODEL_NAME = "minishlab/potion-base-8M" if USE_STATIC_EMBEDDINGS else "all-MiniLM-L6-v2"
+
+# 🤖 The AI brain that writes answers to questions
+QA_MODEL_NAME = "google/flan-t5-small"
+
+# 📦 How many pieces we send to the database in one trip (ChromaDB works best with 250 or less)
+CHROMA_BATCH_SIZE = 250
+
+# 💾 Where we keep converted documents and their embeddings, so identical files are never processed twice
+CACHE_DIR = Path.home() / ".cache" / "streamlitai"
+
+# 🧹 How big the saved documents and embeddings may get before the oldest ones are thrown away
+DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+# ⚡ Where we keep the squeezed (int8) CTranslate2 copy of the answer brain
+QA_CT2_DIR = CACHE_DIR / "flan-t5-small-ct2"
+
+# 🗄️ Where the document database lives on disk, so it survives app restarts
+CHROMA_DIR = CACHE_DIR / "chroma"
+
+# 📐 How the database measures closeness (cosine) and builds its search map (bigger = better map)
+HNSW_SETTINGS = {"hnsw:space": "cosine", "hnsw:construction_ef": 200, "hnsw:M": 32}
+
+# 🎯 How far away (cosine distance) the best match may be before we say "I don't know"
+RELEVANCE_THRESHOLD = 0.75
+
+# 💾 How many answers we remember, and how similar a question must be to reuse one (1.0 = identical)
+SEMANTIC_CACHE_SIZE = 128
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# 👷 How many files we convert at the same time (each conversion already uses several CPU cores)
+MAX_CONVERSION_WORKERS = 2
+
+def content_hash(data: bytes) -> str:
+    """
+    🔑 THE FINGERPRINT MAKER!
+    
+    What this function does (in simple words):
+    - Makes a short, unique "fingerprint" for some content
+    - The same content always gets the same fingerprint, so we can spot repeats
+    - Uses BLAKE2b, which is faster than SHA-256 on modern computers
+    """
+    return hashlib.blake2b(data).hexdigest()
+
+
+def load_from_disk_cache(key: str):
+    """
+    💾📖 THE MEMORY DRAWER READER!
+    
+    What this function does (in simple words):
+    - Looks in our cache folder for something we saved before
+    
+    What it gives back:
+    - The saved thing, or None if we never saved it (or it got damaged)
+    """
+    try:
+        with open(CACHE_DIR / f"{key}.pkl", "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def save_to_disk_cache(key: str, value) -> None:
+    """
+    💾✏️ THE MEMORY DRAWER WRITER!
+    
+    What this function does (in simple words):
+    - Saves something into our cache folder so we never have to compute it again
+    - Writes to a temporary file first, so a half-written file is never read back
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = CACHE_DIR / f"{key}.pkl"
+        temp_path = cache_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as cache_file:
+            pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(cache_path)
+    except OSError as e:
+        # 🤷 Can't write to disk? The app still works, it just won't remember
+        print(f"Could not save cache entry {key}: {e}")
+        return
+    prune_disk_cache()
+
+
+def prune_disk_cache(max_bytes: int = DISK_CACHE_MAX_BYTES) -> None:
+    """
+    🧹 THE MEMORY DRAWER TIDIER!
+    
+    What this function does (in simple words):
+    - Adds up how much space our saved files take
+    - If it's more than max_bytes, throws away the oldest files first until it fits again
+    - Only touches our own .pkl files - the database and model folders are left alone
+    - Never throws away a document's full text ("text-" files): the download buttons still need it
+    """
+    try:
+        entries = []
+        for cache_path in CACHE_DIR.glob("*.pkl"):
+            if cache_path.name.startswith("text-"):
+                continue
+            info = cache_path.stat()
+            entries.append((info.st_mtime, info.st_size, cache_path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, cache_path in sorted(entries):
+            if total <= max_bytes:
+                break
+            cache_path.unlink(missing_ok=True)
+            total -= size
+    except OSError as e:
+        # 🤷 Another visitor may be tidying at the same time - it's fine to try again next save
+        print(f"Could not tidy the cache folder: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def get_docling(fast_mode: bool = True):
+    """
+    🏭 THE CONVERTER FACTORY KEEPER!
+    
+    What this function does (in simple words):
+    - Builds the document converter (with all its reading brains) ONE time only
+    - Streamlit remembers it, so every next file and every next click reuses it
+    - Keeps one converter for fast mode and one for careful mode
+    
+    What it gives back:
+    - A converter that reads PDFs and Word documents
+    """
+    # 🔧 Set up the PDF converter with special settings
+    # (Like preparing the right tools before starting a job)
+    pdf_opts = PdfPipelineOptions(do_ocr=False)  # Don't try to read pictures as text
+    pdf_opts.generate_page_images = False         # We only need the words, not page pictures
+    pdf_opts.generate_picture_images = False      # ...and not the pictures inside the pages either
+    pdf_opts.do_table_structure = not fast_mode   # Figuring out tables is slow - skip it in fast mode
+    device = pick_device()
+    pdf_opts.accelerator_options = AcceleratorOptions(
+        num_threads=4,              # Use 4 workers to process faster
+        device=device,              # Use the fastest chip we have (GPU if possible)
+        # ⚡ Flash-Attention 2 makes the layout brain ~2x faster on NVIDIA cards (if installed)
+        cuda_use_flash_attention2=(
+            device == AcceleratorDevice.CUDA and importlib.util.find_spec("flash_attn") is not None
+        )
+    )
+    
+    # ⚡ pypdfium is ~1.7x faster and uses less than half the memory of docling-parse
+    backend = PyPdfiumDocumentBackend if fast_mode else DoclingParseV2DocumentBackend
+    
+    # 🏭 Create the document converter factory
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=pdf_opts,
+                backend=backend  # The engine that does the work
+            )
+        }
+    )
+
+
+def markdown_cache_key(data: bytes, fast_mode: bool = True) -> str:
+    """🔑 The cache name for a converted PDF/Word file (changes if the file or the reading mode changes)"""
+    return f"markdown-{'fast' if fast_mode else 'full'}-{content_hash(data)}"
+
+
+def decode_text(raw: bytes) -> str:
+    """🔤 Turns the bytes of a text file into letters: UTF-8 first, and only if that fails do we guess the encoding"""
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        best_guess = charset_normalizer.from_bytes(raw).best()
+        return str(best_guess) if best_guess else raw.decode("latin-1", errors="replace")
+
 
-def convert_to_markdown(file_path: str) -> str:
+def convert_to_markdown(file_path: str, fast_mode: bool = True, data: bytes = None, converter=None) -> str:
     """
     🔄 THE MAGIC DOCUMENT CONVERTER! 
     
@@ -45,6 +260,9 @@ def convert_to_markdown(file_path: str) -> str:
     
     What it expects:
     - file_path: The location of your file (like an address)
+    - fast_mode: Use the speedy PDF reader (True) or the careful one that also reads tables (False)
+    - data: The file's bytes, if we already have them in memory (then file_path is only used for its name)
+    - converter: A ready-made Docling converter (helper threads get one handed to them by the main script)
     
     What it gives back:
     - A string of text containing everything from your document
@@ -54,30 +272,28 @@ def convert_to_markdown(file_path: str) -> str:
         path = Path(file_path)  # Turn the file path into something we can work with
         ext = path.suffix.lower()  # Get the file extension (.pdf, .docx, etc.) and make it lowercase
 
+        # 💾 Did we already convert this exact PDF/Word file before? Then skip the slow work!
+        if ext in [".pdf", ".doc", ".docx"]:
+            if data is None:
+                data = path.read_bytes()
+            cache_key = markdown_cache_key(data, fast_mode)
+            cached = load_from_disk_cache(cache_key)
+            if cached is not None:
+                return cached
+            # 📦 Hand the bytes straight to the converter - no need to go through a file on disk
+            source = DocumentStream(name=path.name, stream=BytesIO(data))
+
         # 📕 If it's a PDF file, use special PDF tools
         if ext == ".pdf":
             try:
-                # 🔧 Set up the PDF converter with special settings
-                # (Like preparing the right tools before starting a job)
-                pdf_opts = PdfPipelineOptions(do_ocr=False)  # Don't try to read pictures as text
-                pdf_opts.accelerator_options = AcceleratorOptions(
-                    num_threads=4,              # Use 4 workers to process faster
-                    device=AcceleratorDevice.CPU # Use the computer's CPU
-                )
-                
-                # 🏭 Create the document converter factory
-                converter = DocumentConverter(
-                    format_options={
-                        InputFormat.PDF: PdfFormatOption(
-                            pipeline_options=pdf_opts,
-                            backend=DoclingParseV2DocumentBackend  # The engine that does the work
-                        )
-                    }
-                )
+                # 🏭 Get the ready-made PDF converter (built once, then reused for every file)
+                converter = converter or get_docling(fast_mode)
                 
                 # 🎯 Convert the PDF and extract the text
-                doc = converter.convert(file_path).document
-                result = doc.export_to_markdown(image_mode="placeholder")  # Turn it into readable text
+                doc = converter.convert(source).document
+                result = doc.export_to_markdown(image_placeholder="")  # Turn it into readable text (no picture markers)
+                if result:
+                    save_to_disk_cache(cache_key, result)  # Remember it for next time
                 
                 # 🎉 Return the text, or a helpful message if nothing was found
                 return result if result else f"# {path.name}\n\nDocument conversion completed but no content extracted."
@@ -89,10 +305,12 @@ def convert_to_markdown(file_path: str) -> str:
         # 📘 If it's a Word document (.doc or .docx), use the Word converter
         elif ext in [".doc", ".docx"]:
             try:
-                # 🔧 Create a simple converter for Word documents
-                converter = DocumentConverter()
-                doc = converter.convert(file_path).document  # Convert the document
-                result = doc.export_to_markdown(image_mode="placeholder")  # Turn it into text
+                # 🏭 The same ready-made converter reads Word documents too
+                converter = converter or get_docling(fast_mode)
+                doc = converter.convert(source).document  # Convert the document
+                result = doc.export_to_markdown(image_placeholder="")  # Turn it into text (no picture markers)
+                if result:
+                    save_to_disk_cache(cache_key, result)  # Remember it for next time
                 
                 # 🎉 Return the text, or a helpful message if nothing was found
                 return result if result else f"# {path.name}\n\nDocument conversion completed but no content extracted."
@@ -104,20 +322,12 @@ def convert_to_markdown(file_path: str) -> str:
         # 📄 If it's a simple text file, just read it directly
         elif ext == ".txt":
             try:
-                # 📖 Try to read the file using UTF-8 encoding (the most common way)
-                content = path.read_text(encoding="utf-8")
-                return content if content else f"# {path.name}\n\nEmpty text file."
-                
-            except UnicodeDecodeError:
-                # 🔄 If that doesn't work, try a different encoding
-                try:
-                    content = path.read_text(encoding="latin-1", errors="replace")
-                    return content if content else f"# {path.name}\n\nEmpty text file."
-                except Exception as e:
-                    return f"Error reading text file {path.name}: {str(e)}"
+                if data is None:
+                    data = path.read_bytes()
+                return decode_text(data) if data else f"# {path.name}\n\nEmpty text file."
                     
             except Exception as e:
-                # 😢 If we still can't read it, explain what went wrong
+                # 😢 If we can't read it, explain what went wrong
                 return f"Error reading text file {path.name}: {str(e)}"
 
         # ❌ If it's a file type we don't understand, say so
@@ -129,6 +339,33 @@ def convert_to_markdown(file_path: str) -> str:
         return f"# {Path(file_path).name}\n\nUnexpected error processing file: {str(e)}"
 
 
+def convert_one_file(filename: str, data: bytes, fast_mode: bool = True, converter=None) -> tuple:
+    """
+    👷 THE HELPER'S JOB!
+    
+    What this function does (in simple words):
+    - Converts one uploaded file (straight from its bytes), inside its own helper thread
+    - Uses the converter the main script handed over (helper threads can't use Streamlit's memory)
+    - Gives the filename back too, so we know which file finished first
+    """
+    return filename, convert_to_markdown(filename, fast_mode=fast_mode, data=data, converter=converter)
+
+
+def make_conversion_pool(num_files: int):
+    """
+    👷👷👷 THE HELPER TEAM MAKER!
+    
+    What this function does (in simple words):
+    - Makes a small team of helper threads (never more than MAX_CONVERSION_WORKERS or than we have files)
+    - Helpers share the converter we already loaded, so no model is copied or loaded twice
+    - On a graphics card, it uses one helper so files don't fight over the card
+    """
+    workers = max(1, min(num_files, MAX_CONVERSION_WORKERS))
+    if pick_device() != AcceleratorDevice.CPU:
+        workers = 1
+    return ThreadPoolExecutor(max_workers=workers)
+
+
 def check_app_health():
     """
     🏥 THE APP DOCTOR!
@@ -164,12 +401,8 @@ def check_app_health():
     
     # 🤖 Check if our AI brain is working
     try:
-        # Only test the AI if we haven't loaded it yet (don't want to waste time)
-        if 'qa_pipeline' not in st.session_state:
-            # 🧪 Do a quick test - try to create an AI pipeline
-            test_pipeline = pipeline("text2text-generation", model="google/flan-t5-small", max_length=50)
-            # Clean up the test pipeline
-            del test_pipeline
+        # 🧪 Only peek at the brain's settings file - much cheaper than loading the whole brain!
+        AutoConfig.from_pretrained(QA_MODEL_NAME)
     except Exception as e:
         # 😢 If the AI brain isn't working, add it to our problem list
         issues.append(f"AI model loading issue: {str(e)}")
@@ -184,18 +417,76 @@ def show_loading_animation(text="Processing..."):
     What this function does (in simple words):
     - Shows a spinning wheel while the computer is working hard
     - It's like showing "Please wait..." so people don't get worried
-    - Adds a tiny pause to make sure users see the message
+    - The wheel keeps spinning for exactly as long as the real work takes - no extra waiting!
     
     Think of it like this: ⏳💭✨
-    (Show spinner) → (Let user know we're working) → (Make it look nice)
+    (Show spinner) → (Do the work) → (Spinner disappears)
+    
+    How to use it:
+        with show_loading_animation("Processing your documents..."):
+            do_the_work()
     
     What it expects:
     - text: The message to show (like "Processing your documents...")
+    
+    What it gives back:
+    - A spinner to use in a `with` block
+    """
+    return st.spinner(text)  # 🌀 Show the spinning animation with our message
+
+
+
+@st.cache_resource(show_spinner=False)
+def get_chroma_client():
+    """
+    🗄️ THE FOREVER DATABASE!
+    
+    What this function does (in simple words):
+    - Opens our document database from a folder on the computer
+    - Because it's saved on disk, reruns and restarts don't have to rebuild it
+    """
+    CHROMA_DIR.mkdir(parents=True, exist_ok=True)
+    return chromadb.PersistentClient(path=str(CHROMA_DIR))
+
+
+def completion_marker(collection_name: str) -> Path:
+    """🏁 The little note next to the database that says which files a storage box was FULLY filled from"""
+    return CHROMA_DIR / f"{collection_name}.complete"
+
+
+def mark_collection_complete(collection_name: str, fingerprint: str) -> None:
+    """
+    🏁✏️ THE "ALL DONE!" NOTE WRITER!
+    
+    What this function does (in simple words):
+    - Writes down the files' fingerprint AFTER every piece is safely in the storage box
+    - If adding was cut off halfway, this note is never written, so the box is rebuilt next time
     """
-    with st.spinner(text):  # 🌀 Show the spinning animation with our message
-        time.sleep(0.3)  # 😴 Take a tiny nap (0.3 seconds) so users can see the message
+    try:
+        completion_marker(collection_name).write_text(fingerprint, encoding="utf-8")
+    except OSError as e:
+        # 🤷 Can't write the note? The box just gets rebuilt next time
+        print(f"Could not mark collection '{collection_name}' complete: {e}")
 
 
+def find_indexed_collection(client, collection_name: str, fingerprint: str):
+    """
+    🔍📦 THE "ALREADY DONE?" CHECKER!
+    
+    What this function does (in simple words):
+    - Looks for a storage box that was completely filled from exactly these files before
+    
+    What it gives back:
+    - The filled collection, or None if we need to build it again
+    """
+    try:
+        if completion_marker(collection_name).read_text(encoding="utf-8") != fingerprint:
+            return None  # 📝 Filled from other files (or never finished)
+        collection = client.get_collection(name=collection_name)
+    except Exception:
+        return None  # 🤷 No note or no box yet
+    return collection if collection.count() > 0 else None
+
 
 def reset_collection(client, collection_name: str):
     """
@@ -215,6 +506,9 @@ def reset_collection(client, collection_name: str):
     What it gives back:
     - A new empty collection ready for documents
     """
+    # 🏁 Tear up the "all done" note first - the new box isn't filled yet
+    completion_marker(collection_name).unlink(missing_ok=True)
+    
     try:
         # 🗑️ Try to delete the old collection
         client.delete_collection(name=collection_name)
@@ -224,79 +518,291 @@ def reset_collection(client, collection_name: str):
         print(f"Collection '{collection_name}' doesn't exist or already deleted")
     
     # 📦 Create a brand new, empty collection
-    new_collection = client.create_collection(name=collection_name)
+    new_collection = client.create_collection(name=collection_name, metadata=HNSW_SETTINGS)
     print(f"Created new empty collection '{collection_name}'")  # Tell the console we made it
     return new_collection  # 🎁 Give back the new empty box
 
 
-def add_text_to_chromadb(text: str, filename: str, collection_name: str = "documents"):
+def pick_device():
     """
-    📚➡️🧠 THE SMART STORAGE HELPER!
+    🖥️🔍 THE HARDWARE DETECTIVE!
     
     What this function does (in simple words):
-    - Takes a long document and cuts it into smaller pieces
-    - Stores each piece in our smart database so we can find them later
+    - Looks for the fastest helper chip this computer has
+    - NVIDIA graphics card (CUDA) first, then Apple chip (MPS), otherwise the normal CPU
     
-    Think of it like this: 📄✂️📦🏷️
-    (Big document) → (Cut into pieces) → (Store in smart boxes) → (Label everything)
+    What it gives back:
+    - An AcceleratorDevice telling everyone where to do the heavy work
+    """
+    if torch.cuda.is_available():
+        return AcceleratorDevice.CUDA
+    if torch.backends.mps.is_available():
+        return AcceleratorDevice.MPS
+    return AcceleratorDevice.CPU
+
+
+def pick_onnx_file() -> str:
+    """
+    🔍⚡ THE ONNX FLAVOUR PICKER!
     
-    What it expects:
-    - text: The content of your document (all the words)
-    - filename: What the document is called
-    - collection_name: Which storage box to put it in
+    What this function does (in simple words):
+    - The embedding brain comes in several squeezed (int8) ONNX versions, each tuned for one kind of CPU
+    - Picks the one made for THIS computer's chip (ARM, or Intel/AMD with AVX-512 VNNI, AVX-512 or AVX2)
+    - If we can't tell (or the chip has none of those), uses the normal full-size ONNX file that runs everywhere
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    flags = set()
+    try:
+        # 🐧 Linux lists the chip's special skills in /proc/cpuinfo
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    flags = set(line.split(":", 1)[1].split())
+                    break
+    except OSError:
+        pass
+    if "avx512_vnni" in flags:
+        return "onnx/model_qint8_avx512_vnni.onnx"
+    if "avx512f" in flags:
+        return "onnx/model_qint8_avx512.onnx"
+    if "avx2" in flags:
+        return "onnx/model_quint8_avx2.onnx"
+    return "onnx/model.onnx"
+
+
+@st.cache_resource(show_spinner=False)
+def load_embedding_model():
+    """
+    🧠⚡ THE SPEEDY BRAIN LOADER!
+    
+    What this function does (in simple words):
+    - Loads the brain that understands what text means
+    - Uses the super fast static brain if USE_STATIC_EMBEDDINGS is turned on
+    - Uses the graphics card (GPU) if the computer has one
+    - Otherwise tries the speedy ONNX version made for this computer's chip (see pick_onnx_file)
+    - If the speedy version isn't available, uses the normal version instead
+    - Labels the brain with how it runs (cache_tag), because each way gives slightly different numbers
     
     What it gives back:
-    - The collection where everything is stored
+    - A SentenceTransformer model ready to understand text
     """
-    # Split text into chunks
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=700,       
-        chunk_overlap=100,     
+    if USE_STATIC_EMBEDDINGS:
+        # 📖 A static brain just looks words up in a table - no heavy thinking needed!
+        # (The same brain is used for documents AND questions, so their numbers always match)
+        model = SentenceTransformer(modules=[StaticEmbedding.from_model2vec(EMBEDDING_MODEL_NAME)])
+        model.cache_tag = "static"
+        return model
+    
+    device = pick_device()
+    if device != AcceleratorDevice.CPU:
+        # 🚀 Graphics cards are 2-10x faster at this kind of math
+        model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=device.value)
+        model.cache_tag = f"{device.value}-fp32"
+        if device == AcceleratorDevice.CUDA:
+            # ⚡ NVIDIA cards love half-size (fp16) numbers and a compiled brain: ~2x faster again
+            model.half()
+            model.cache_tag = f"{device.value}-fp16"
+            model[0].auto_model = torch.compile(model[0].auto_model, dynamic=True)
+            # 🔥 Warm up now, so the slow compile happens here and not on the first upload
+            model.encode(["Warming up the brain."], show_progress_bar=False)
+        return model
+    
+    try:
+        # ⚡ ONNX + int8 runs 2-3x faster on a normal computer CPU and needs half the memory
+        onnx_file = pick_onnx_file()
+        model = SentenceTransformer(
+            EMBEDDING_MODEL_NAME,
+            backend="onnx",
+            model_kwargs={"file_name": onnx_file}
+        )
+        model.cache_tag = f"onnx-{Path(onnx_file).stem}"
+        return model
+    except Exception as e:
+        # 🤷 No onnxruntime (or an older sentence-transformers)? The normal brain works too!
+        print(f"ONNX embedding model unavailable, using PyTorch instead: {e}")
+    
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu")
+    model.cache_tag = "cpu-fp32"
+    try:
+        # 🔧 Intel computers can tune the brain even more if Intel's helper is installed
+        import intel_extension_for_pytorch as ipex
+        model[0].auto_model = ipex.optimize(model[0].auto_model.eval())
+    except ImportError:
+        pass  # No Intel helper? That's okay!
+    return model
+
+
+@st.cache_resource(show_spinner=False)
+def get_qa_pipeline():
+    """
+    🤖📦 THE AI BRAIN KEEPER!
+    
+    What this function does (in simple words):
+    - Loads the AI brain that writes answers ONE time only
+    - Streamlit remembers it, so every next question reuses the same brain
+    - Loading the brain takes seconds, answering only takes a moment!
+    
+    - Uses a squeezed (int8) CTranslate2 copy of the brain if possible - it answers 2-4x faster on a CPU
+    
+    What it gives back:
+    - The ready-to-use question answering pipeline
+    """
+    try:
+        import ctranslate2
+        if not (QA_CT2_DIR / "model.bin").exists():
+            # 🔄 First time only: make the squeezed copy of the brain and keep it on disk
+            ctranslate2.converters.TransformersConverter(QA_MODEL_NAME).convert(
+                str(QA_CT2_DIR), quantization="int8", force=True
+            )
+        translator = ctranslate2.Translator(str(QA_CT2_DIR), device="cpu", compute_type="int8")
+        tokenizer = AutoTokenizer.from_pretrained(QA_MODEL_NAME)
+        
+        def generate(prompt, max_length=150):
+            # ✍️ Same answer format as the normal pipeline, so nobody else has to change
+            tokens = tokenizer.convert_ids_to_tokens(tokenizer.encode(prompt))
+            result = translator.translate_batch([tokens], max_decoding_length=max_length)
+            output_ids = tokenizer.convert_tokens_to_ids(result[0].hypotheses[0])
+            return [{"generated_text": tokenizer.decode(output_ids, skip_special_tokens=True)}]
+        
+        return generate
+    except Exception as e:
+        # 🤷 No ctranslate2 (or the conversion failed)? The normal brain works too!
+        print(f"CTranslate2 answer model unavailable, using transformers instead: {e}")
+    
+    return pipeline("text2text-generation", model=QA_MODEL_NAME, device=-1)  # device=-1 means "use the CPU"
+
+
+@st.cache_resource(show_spinner=False)
+def get_text_splitter():
+    """
+    ✂️ THE SCISSORS KEEPER!
+    
+    What this function does (in simple words):
+    - Makes the scissors that cut documents into smaller pieces ONE time
+    - Every document after that reuses the same scissors
+    
+    What it gives back:
+    - A RecursiveCharacterTextSplitter ready to cut text
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=700,
+        chunk_overlap=100,
         separators=["\n\n", "\n", " ", ""]
     )
-    chunks = splitter.split_text(text)
+
+
+def embedding_model_tag() -> str:
+    """🏷️ Which brain made our embeddings AND how it ran (like "all-MiniLM-L6-v2|onnx-model_qint8_arm64")"""
+    return f"{EMBEDDING_MODEL_NAME}|{load_embedding_model().cache_tag}"
+
+
+def embedding_cache_key(text: str) -> str:
+    """🔑 The cache name for a document's pieces + embeddings (changes if the text, the brain or how it runs changes)"""
+    fingerprint = content_hash((embedding_model_tag() + "\n" + text).encode("utf-8"))
+    return f"chunks-{fingerprint}"
+
+
+def iter_document_chunks(documents: dict):
+    """
+    ✂️🚶 THE PIECE-BY-PIECE CUTTER!
     
-    # Initialize components (reuse if possible)
-    if not hasattr(add_text_to_chromadb, 'client'):
-        add_text_to_chromadb.client = chromadb.Client()  # The database manager
-        add_text_to_chromadb.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')  # The brain that understands text
-        add_text_to_chromadb.collections = {}  # A dictionary to remember our storage boxes
+    What this function does (in simple words):
+    - Goes through the documents one at a time and hands out their pieces one by one
+    - Pieces we've seen before come with their saved "understanding" (embedding)
+    - New pieces come with None, so we know the AI brain still has to read them
     
-    # Get or create collection
-    if collection_name not in add_text_to_chromadb.collections:
-        try:
-            # 🔍 Try to find an existing storage box with this name
-            collection = add_text_to_chromadb.client.get_collection(name=collection_name)
-        except:
-            # 📦 If we can't find it, create a new one
-            collection = add_text_to_chromadb.client.create_collection(name=collection_name)
-        # 💾 Remember this storage box for next time
-        add_text_to_chromadb.collections[collection_name] = collection
+    What it gives back (one at a time):
+    - (filename, piece number, piece text, saved embedding or None)
+    """
+    splitter = get_text_splitter()
+    for filename, text in documents.items():
+        # 💾 Reuse the pieces and understanding we already saved for documents we've seen before
+        cached = load_from_disk_cache(embedding_cache_key(text))
+        if cached is not None:
+            for i, (chunk, embedding) in enumerate(zip(cached["chunks"], cached["embeddings"])):
+                yield filename, i, chunk, embedding
+        else:
+            for i, chunk in enumerate(splitter.split_text(text)):
+                yield filename, i, chunk, None
+
+
+def add_documents_to_chromadb(documents: dict, collection):
+    """
+    📚📚📚➡️🧠 THE BULK STORAGE HELPER!
+    
+    What this function does (in simple words):
+    - Lines up the pieces of ALL the documents, one after another
+    - Grabs a big handful of pieces (even from different documents), lets the AI brain understand them, and stores the handful in one go
+    - Only one handful of "understanding" is in memory at once, so huge documents don't fill up the computer
+    
+    Think of it like this: 📄📄📄✂️ → 🧠📦 → 🧠📦 → ...
+    (Cut the documents) → (Understand a handful) → (Store the handful) → (Next handful!)
+    
+    What it expects:
+    - documents: A dictionary of {filename: text}
+    - collection: The storage box to put everything in
     
-    collection = add_text_to_chromadb.collections[collection_name]  # Get our storage box
+    What it gives back:
+    - The collection where everything is stored
+    """
+    pieces = iter_document_chunks(documents)
+    new_pieces = {}  # filename -> (new pieces, their embeddings), saved once the document is finished
+    total_chunks = 0
+    
+    def remember(filename):
+        # 💾 Remember a finished document's pieces for next time
+        if filename in new_pieces:
+            chunks, embeddings = new_pieces.pop(filename)
+            save_to_disk_cache(
+                embedding_cache_key(documents[filename]),
+                {"chunks": chunks, "embeddings": np.stack(embeddings)}
+            )
     
-    # Process chunks
-    for i, chunk in enumerate(chunks):
-        # 🧠 Let the AI brain understand it means
-        embedding = add_text_to_chromadb.embedding_model.encode(chunk).tolist()
+    # 📦 Understand and store one handful at a time
+    while group := list(islice(pieces, CHROMA_BATCH_SIZE)):
+        new_texts = [chunk for _, _, chunk, embedding in group if embedding is None]
+        # (encode() already sorts each handful by length and un-sorts the results,
+        #  so similar-sized pieces share a batch and little time is wasted on padding)
+        fresh_embeddings = iter(load_embedding_model().encode(
+            new_texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            normalize_embeddings=True
+        ) if new_texts else [])
         
-        # 🏷️ Create a label with information about this
-        metadata = {
-            "filename": filename,      # Which document this came from
-            "chunk_index": i,         # Which piece number this is (0, 1, 2, etc.)
-            "chunk_size": len(chunk)  # How big this piece is
-        }
+        group_embeddings = []
+        for filename, _, chunk, embedding in group:
+            if embedding is None:
+                embedding = next(fresh_embeddings)
+                chunks, embeddings = new_pieces.setdefault(filename, ([], []))
+                chunks.append(chunk)
+                embeddings.append(embedding)
+            group_embeddings.append(embedding)
         
-        # 📦 Store in our smart storage box
         collection.add(
-            embeddings=[embedding],    # The AI's understanding of what this means
-            documents=[chunk],         # The actual text
-            metadatas=[metadata],      # The label with information
-            ids=[f"{filename}_chunk_{i}"]  # A unique name for this piece
+            embeddings=np.stack(group_embeddings),  # The AI's understanding of each piece (a numpy array, no list copy)
+            documents=[chunk for _, _, chunk, _ in group],  # The actual text
+            metadatas=[{
+                "filename": filename,                # Which document this came from
+                "chunk_index": i,                    # Which piece number this is (0, 1, 2, etc.)
+                "chunk_size": len(chunk)             # How big this piece is
+            } for filename, i, chunk, _ in group],
+            ids=[f"{filename}_chunk_{i}" for filename, i, _, _ in group]  # A unique name for each piece
         )
+        total_chunks += len(group)
+        
+        # 💾 Every document before the last one in this handful is finished now
+        last_filename = group[-1][0]
+        for filename in [name for name in new_pieces if name != last_filename]:
+            remember(filename)
     
+    for filename in list(new_pieces):
+        remember(filename)
+
     # 🎉 Tell everyone we're done and how many pieces we stored
-    print(f"Added {len(chunks)} chunks from {filename}")
+    print(f"Added {total_chunks} chunks from {len(documents)} documents")
     return collection
 
 
@@ -313,23 +819,31 @@ def get_answer_with_source(collection, question):
     - The AI reads and writes a smart answer
     - We also tell you which document the answer came from!
     """
+    # ⚡ STEP 0: Did someone already ask this (or almost the same) question?
+    question_embedding = load_embedding_model().encode(question, normalize_embeddings=True)
+    cached = lookup_semantic_cache(question_embedding)
+    if cached:
+        return cached  # 🎉 Instant answer - no searching or AI thinking needed!
+    
     # 🔍 STEP 1: Search through all our document pieces to find the best matches
     results = collection.query(
-        query_texts=[question],  # What are we looking for?
-        n_results=3             # Give us the 3 best matches
+        query_embeddings=[question_embedding.tolist()],  # What are we looking for? (same brain as the documents)
+        n_results=3,            # Give us the 3 best matches
+        include=["documents", "distances", "metadatas"]  # Only bring back what we actually use
     )
     
     # 📦 STEP 2: Unpack what we found
     docs = results["documents"][0]      # The actual text we found
     distances = results["distances"][0]  # How well matches (smaller = better)
-    ids = results["ids"][0]             # The names of the pieces we found
-    metadatas = results["metadatas"][0] if results["metadatas"] else []  # Info about each piece
     
-    # 🤔 STEP 3: Check if we found anything good enough to use
+    # 🤔 STEP 3: Check if we found anything good enough to use - BEFORE doing any more work
     # (If the closest match is still far away, we probably don't have the answer)
-    if not docs or min(distances) > 1.5:  # 1.5 is our "good enough" threshold
+    # ChromaDB sorts the matches closest-first, so we only need to look at the first one
+    if not docs or distances[0] > RELEVANCE_THRESHOLD:  # Our "good enough" line
         return "I cannot answer this question based on the uploaded documents.", "No source"
     
+    metadatas = results["metadatas"][0] if results["metadatas"] else []  # Info about each piece
+    
     # Create structured context for the AI model
     if metadatas:
         # Include which document each piece came from (like footnotes in a book)
@@ -353,25 +867,83 @@ Instructions: Answer ONLY using the information provided above. If the answer is
 Answer:"""
     
     # 🤖 STEP 6: Ask the AI brain to answer our question
-    ai_model = pipeline("text2text-generation", model="google/flan-t5-small")
+    ai_model = get_qa_pipeline()
     response = ai_model(prompt, max_length=150)  # Don't make the answer too long
     
     # ✨ STEP 7: Clean up the AI's answer
     answer = response[0]['generated_text'].strip()
     
     # 📚 STEP 8: Figure out which document the answer came from
-    if metadatas and len(metadatas) > 0:
-        best_source = metadatas[0].get('filename', 'Unknown source')
-    else:
-        # Fallback: try to extract from ID
-        try:
-            best_source = ids[0].split('_chunk_')[0] if ids else "Unknown source"
-        except:
-            best_source = "Unknown source"
+    # (Every piece is stored with its filename, so the closest piece tells us the source)
+    best_source = metadatas[0].get('filename', 'Unknown source') if metadatas else "Unknown source"
+    
+    # 💾 STEP 9: Remember this answer in case a similar question comes up again
+    save_to_semantic_cache(question_embedding, answer, best_source)
     
-    # 🎁 STEP 9: Give back both the answer and where it came from
+    # 🎁 STEP 10: Give back both the answer and where it came from
     return answer, best_source
 
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def cached_answer(_collection, collection_id: str, question_key: str, _question: str):
+    """
+    ⚡💾 THE INSTANT REPEAT ANSWERER!
+    
+    What this function does (in simple words):
+    - Remembers the answer to the exact same question (ignoring capitals and extra spaces) for 10 minutes
+    - Asking again is instant - no searching, no AI thinking
+    - New documents make a new collection (with a new id), so old answers are never reused for them
+    
+    What it gives back:
+    - The answer and where it came from, just like get_answer_with_source
+    """
+    return get_answer_with_source(_collection, _question)
+
+
+def lookup_semantic_cache(question_embedding):
+    """
+    🧠💾 THE ANSWER MEMORY CHECKER!
+    
+    What this function does (in simple words):
+    - Compares a new question with the questions we already answered
+    - If one of them means almost exactly the same thing, reuse its answer
+    - Answers we reuse move to the back of the line so they're kept longest
+    
+    What it expects:
+    - question_embedding: The AI's understanding of the new question (normalized)
+    
+    What it gives back:
+    - (answer, source) if we found a match, otherwise None
+    """
+    cache = st.session_state.setdefault('semantic_cache', [])
+    if not cache:
+        return None
+    
+    # 📐 One dot product compares the question with every remembered question at once
+    cached_matrix = np.stack([entry[0] for entry in cache])
+    similarities = cached_matrix @ question_embedding
+    best = int(np.argmax(similarities))
+    if similarities[best] <= SEMANTIC_CACHE_THRESHOLD:
+        return None
+    
+    # 🔝 Mark this answer as recently used
+    entry = cache.pop(best)
+    cache.append(entry)
+    return entry[1], entry[2]
+
+
+def save_to_semantic_cache(question_embedding, answer, source):
+    """
+    💾 THE ANSWER MEMORY SAVER!
+    
+    What this function does (in simple words):
+    - Remembers a question together with its answer and source
+    - Forgets the least recently used answer when the memory is full
+    """
+    cache = st.session_state.setdefault('semantic_cache', [])
+    cache.append((question_embedding, answer, source))
+    if len(cache) > SEMANTIC_CACHE_SIZE:
+        cache.pop(0)  # 🧹 The oldest (least recently used) answer is always first
+
 # FEATURE 2: Search history functions
 def add_to_search_history(question, answer, source):
     """
@@ -412,6 +984,75 @@ def show_search_history():
             st.write("**Answer:**", search['answer'])
             st.write("**Source:**", search['source'])
 
+def save_document_text(text: str) -> str:
+    """💾 Saves a document's full text to disk and gives back the name to find it again"""
+    text_key = "text-" + content_hash(text.encode("utf-8"))
+    save_to_disk_cache(text_key, text)
+    return text_key
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def load_document_text(text_key: str) -> str:
+    """
+    📖 Reads a document's full text back from disk (keeps the last few handy in memory)
+    If the file is gone, it raises FileNotFoundError instead of giving back "" -
+    Streamlit doesn't remember errors, so a missing file is never cached as an empty document
+    """
+    text = load_from_disk_cache(text_key)
+    if text is None:
+        raise FileNotFoundError(text_key)
+    return text
+
+
+def compute_stats(content: str) -> dict:
+    """📏 Counts the words and size of a document once, when it's processed (not on every click)"""
+    return {"words": len(content.split()), "bytes": len(content.encode("utf-8"))}
+
+
+# 🃏 The document card design, made once and filled in for every document
+CARD_TPL = """
+<div style="
+    background: rgba(255, 255, 255, 0.95);
+    backdrop-filter: blur(20px);
+    border-radius: 16px;
+    padding: 20px;
+    margin: 10px 0;
+    border: 1px solid rgba(255, 255, 255, 0.4);
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
+    transition: all 0.3s ease;
+    position: relative;
+    overflow: hidden;
+">
+    <div style="text-align: center; margin-bottom: 15px;">
+        <div style="font-size: 2.5rem; margin-bottom: 8px;">{icon}</div>
+        <h4 style="color: #2c3e50; margin: 0; font-size: 16px; font-weight: 600;">
+            {name}
+        </h4>
+        <p style="color: #64748b; margin: 5px 0 0 0; font-size: 12px;">
+            {ext} • {words} words
+        </p>
+    </div>
+</div>
+"""
+
+
+# 🎨 The icon and color for each file type
+ICON_BY_EXT = {
+    '.pdf': ("📕", "#ef4444"),
+    '.doc': ("📘", "#3b82f6"),
+    '.docx': ("📘", "#3b82f6"),
+    '.txt': ("📄", "#10b981"),
+}
+DEFAULT_ICON = ("📄", "#6b7280")
+
+
+def describe_file(filename: str) -> tuple:
+    """🏷️ Works out a file's name, type, icon and color once, when it's processed: (stem, ext, icon, color)"""
+    path = Path(filename)
+    file_ext = path.suffix.lower()
+    return (path.stem, file_ext) + ICON_BY_EXT.get(file_ext, DEFAULT_ICON)
+
+
 # FEATURE 3: Modern card-based document manager
 def show_document_manager():
     """Display modern card-based document manager interface"""
@@ -454,58 +1095,22 @@ def show_document_manager():
         col_index = i % len(cols)
         
         with cols[col_index]:
-            # Get file info
-            file_ext = Path(filename).suffix.lower()
-            file_name_display = Path(filename).stem
+            # Get file info (name, type, icon and color were worked out when it was processed)
+            meta = st.session_state.file_meta.get(filename) or describe_file(filename)
+            file_name_display, file_ext, file_icon, file_color = meta
             
-            # Calculate stats
-            word_count = 0
-            file_size_kb = 0
-            if hasattr(st.session_state, 'document_contents') and filename in st.session_state.document_contents:
-                content = st.session_state.document_contents[filename]
-                word_count = len(content.split())
-                file_size_kb = len(content.encode('utf-8')) / 1024
+            # Look up the stats we worked out when the document was processed
+            stats = st.session_state.document_stats.get(filename, {"words": 0, "bytes": 0})
+            word_count = stats["words"]
+            file_size_kb = stats["bytes"] / 1024
             
-            # Choose icon based on file type
-            if file_ext == '.pdf':
-                file_icon = "📕"
-                file_color = "#ef4444"
-            elif file_ext in ['.doc', '.docx']:
-                file_icon = "📘"
-                file_color = "#3b82f6"
-            elif file_ext == '.txt':
-                file_icon = "📄"
-                file_color = "#10b981"
-            else:
-                file_icon = "📄"
-                file_color = "#6b7280"
-            
-            # Create beautiful document card
-            card_html = f"""
-            <div style="
-                background: rgba(255, 255, 255, 0.95);
-                backdrop-filter: blur(20px);
-                border-radius: 16px;
-                padding: 20px;
-                margin: 10px 0;
-                border: 1px solid rgba(255, 255, 255, 0.4);
-                box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-                transition: all 0.3s ease;
-                position: relative;
-                overflow: hidden;
-            ">
-                <div style="text-align: center; margin-bottom: 15px;">
-                    <div style="font-size: 2.5rem; margin-bottom: 8px;">{file_icon}</div>
-                    <h4 style="color: #2c3e50; margin: 0; font-size: 16px; font-weight: 600;">
-                        {file_name_display}
-                    </h4>
-                    <p style="color: #64748b; margin: 5px 0 0 0; font-size: 12px;">
-                        {file_ext.upper()} • {word_count:,} words
-                    </p>
-                </div>
-                
-            </div>
-            """
+            # Create beautiful document card (fill in the ready-made template)
+            card_html = CARD_TPL.format_map({
+                "icon": file_icon,
+                "name": file_name_display,
+                "ext": file_ext.upper(),
+                "words": f"{word_count:,}"
+            })
             
             st.markdown(card_html, unsafe_allow_html=True)
             
@@ -520,18 +1125,23 @@ def show_document_manager():
             with col_b:
                 # Download button
                 if hasattr(st.session_state, 'document_contents') and filename in st.session_state.document_contents:
-                    content = st.session_state.document_contents[filename]
-                    base_name = Path(filename).stem
-                    download_filename = f"{base_name}_converted.md"
-                    st.download_button(
-                        label="💾",
-                        data=content,
-                        file_name=download_filename,
-                        mime="text/markdown",
-                        key=f"download_{i}",
-                        help="Download as markdown",
-                        use_container_width=True
-                    )
+                    # 💾 The full text lives on disk, not in the session - fetch it just for the button
+                    try:
+                        content = load_document_text(st.session_state.document_contents[filename]["text_key"])
+                    except FileNotFoundError:
+                        # 😢 The saved text was removed - say so instead of offering an empty file
+                        st.error("⚠️ Saved text is gone - please upload this file again")
+                    else:
+                        download_filename = f"{file_name_display}_converted.md"
+                        st.download_button(
+                            label="💾",
+                            data=content,
+                            file_name=download_filename,
+                            mime="text/markdown",
+                            key=f"download_{i}",
+                            help="Download as markdown",
+                            use_container_width=True
+                        )
             
             with col_c:
                 # Delete button
@@ -541,6 +1151,8 @@ def show_document_manager():
                     # Remove from document contents
                     if hasattr(st.session_state, 'document_contents') and filename in st.session_state.document_contents:
                         del st.session_state.document_contents[filename]
+                    st.session_state.document_stats.pop(filename, None)
+                    st.session_state.file_meta.pop(filename, None)
                     # Clear preview state
                     if f'show_preview_{i}' in st.session_state:
                         del st.session_state[f'show_preview_{i}']
@@ -551,8 +1163,7 @@ def show_document_manager():
             if st.session_state.get(f'show_preview_{i}', False):
                 with st.expander(f"📖 Preview: {file_name_display}", expanded=True):
                     if hasattr(st.session_state, 'document_contents') and filename in st.session_state.document_contents:
-                        content = st.session_state.document_contents[filename]
-                        preview_text = content[:800] + "..." if len(content) > 800 else content
+                        preview_text = st.session_state.document_contents[filename]["preview"]
                         
                         # Styled preview container - using code block to avoid HTML conflicts
                         st.code(preview_text, language="text")
@@ -575,12 +1186,10 @@ def show_document_stats():
     total_docs = len(st.session_state.uploaded_files_processed)
     
     # Calculate word count if available
-    total_words = 0
-    if hasattr(st.session_state, 'document_contents'):
-        total_words = sum(
-            len(st.session_state.document_contents.get(filename, "").split()) 
-            for filename in st.session_state.uploaded_files_processed
-        )
+    total_words = sum(
+        st.session_state.document_stats.get(filename, {}).get("words", 0)
+        for filename in st.session_state.uploaded_files_processed
+    )
     
     avg_words = total_words // total_docs if total_docs > 0 and total_words > 0 else 0
     
@@ -602,13 +1211,11 @@ def show_document_stats():
         else:
             st.metric("Average Words/Doc", "N/A")
     
-    # Show breakdown by file type
-    file_types = {}
-    for filename in st.session_state.uploaded_files_processed:
-        ext = Path(filename).suffix.lower()
-        if not ext:
-            ext = "no extension"
-        file_types[ext] = file_types.get(ext, 0) + 1
+    # Show breakdown by file type (using the file types we worked out when the files were processed)
+    file_types = Counter(
+        (st.session_state.file_meta.get(filename) or describe_file(filename))[1] or "no extension"
+        for filename in st.session_state.uploaded_files_processed
+    )
     
     st.write("**File Types:**")
     for ext, count in file_types.items():
@@ -631,13 +1238,20 @@ def create_tabbed_interface():
             help=None
         )
         
+        # 📦 Grab each file's bytes and size ONE time: (name, bytes, size in MB)
+        files_meta = []
+        for file in uploaded_files or []:
+            data = file.getvalue()
+            files_meta.append((file.name, data, len(data) / (1024 * 1024)))
+        
         # Show file preview if files are selected
-        if uploaded_files:
+        if files_meta:
             st.markdown("#### 📋 Selected Files")
-            for file in uploaded_files:
-                file_size = len(file.getvalue()) / (1024 * 1024)  # Size in MB
+            # 🃏 Build all the cards first, then show them in ONE go
+            preview_cards = []
+            for name, _, file_size in files_meta:
                 size_color = "#22c55e" if file_size <= 10 else "#ef4444"
-                st.markdown(f"""
+                preview_cards.append(f"""
                 <div style="
                     background: rgba(255, 255, 255, 0.9);
                     border-radius: 8px;
@@ -645,10 +1259,17 @@ def create_tabbed_interface():
                     margin: 8px 0;
                     border-left: 4px solid {size_color};
                 ">
-                    📄 <strong>{file.name}</strong> • 
+                    📄 <strong>{name}</strong> • 
                     <span style="color: {size_color};">{file_size:.1f} MB</span>
-                </div>
-                """, unsafe_allow_html=True)
+                </div>""")
+            st.markdown("".join(preview_cards), unsafe_allow_html=True)
+        
+        # ⚡ Let users pick speed or extra-careful PDF reading
+        fast_mode = st.toggle(
+            "⚡ Fast mode",
+            value=True,
+            help="Reads PDFs faster with less memory. Turn off for high quality table extraction."
+        )
         
         # Enhanced process button
         col1, col2, col3 = st.columns([1, 2, 1])
@@ -664,15 +1285,11 @@ def create_tabbed_interface():
         if process_clicked:
             if uploaded_files:
                 # Validate files before processing
-                valid_files = []
-                errors = []
-                
-                for file in uploaded_files:
-                    file_size = len(file.getvalue()) / (1024 * 1024)
-                    if file_size > 10:
-                        errors.append(f"❌ {file.name}: File too large ({file_size:.1f}MB > 10MB)")
-                    else:
-                        valid_files.append(file)
+                valid_files = [(name, data) for name, data, file_size in files_meta if file_size <= 10]
+                errors = [
+                    f"❌ {name}: File too large ({file_size:.1f}MB > 10MB)"
+                    for name, _, file_size in files_meta if file_size > 10
+                ]
                 
                 if errors:
                     for error in errors:
@@ -683,10 +1300,19 @@ def create_tabbed_interface():
                     with st.container():
                         st.markdown("#### 🔄 Processing Documents...")
                         
-                        # Create/reset ChromaDB collection
-                        show_loading_animation("🗄️ Preparing document storage...")
-                        client = chromadb.Client()
-                        collection = reset_collection(client, "uploaded_documents")
+                        # 🔑 Fingerprint these exact files (and settings), so we can tell if they're already stored
+                        files_fingerprint = content_hash("\n".join(
+                            [embedding_model_tag(), f"fast={fast_mode}"] +
+                            [f"{name}:{content_hash(data)}" for name, data in valid_files]
+                        ).encode("utf-8"))
+                        
+                        # Reuse the saved collection if it was built from the same files, otherwise start fresh
+                        with show_loading_animation("🗄️ Preparing document storage..."):
+                            client = get_chroma_client()
+                            collection = find_indexed_collection(client, "uploaded_documents", files_fingerprint)
+                            already_indexed = collection is not None
+                            if not already_indexed:
+                                collection = reset_collection(client, "uploaded_documents")
                         
                         # Progress tracking with enhanced UI
                         progress_bar = st.progress(0)
@@ -694,53 +1320,84 @@ def create_tabbed_interface():
                         
                         processed_files = []
                         document_contents = {}
+                        document_stats = {}
+                        file_meta = {}
                         total_files = len(valid_files)
                         processing_errors = []
                         
-                        for idx, file in enumerate(valid_files):
+                        # 👷 Convert a few files side by side on our small helper team
+                        status_text.text(f"🔄 Converting {total_files} files to searchable format...")
+                        with show_loading_animation(f"Processing {total_files} files..."), \
+                                make_conversion_pool(total_files) as helpers:
+                            names_by_future = {}  # Which files are waiting on each conversion
+                            futures_by_content = {}  # One conversion per unique file, even if it's uploaded twice
+                            converter = None  # 🏭 Fetched here on the main script, only if a PDF/Word file needs it
+                            for name, data in valid_files:
+                                content_key = (Path(name).suffix.lower(), content_hash(data))
+                                future = futures_by_content.get(content_key)
+                                if future is None:
+                                    # 💾 Converted this exact file before? Skip the helper and use the saved text
+                                    cached_text = None
+                                    if content_key[0] in (".pdf", ".doc", ".docx"):
+                                        cached_text = load_from_disk_cache(markdown_cache_key(data, fast_mode))
+                                    if cached_text is not None:
+                                        future = Future()
+                                        future.set_result((name, cached_text))
+                                    else:
+                                        if converter is None and content_key[0] in (".pdf", ".doc", ".docx"):
+                                            converter = get_docling(fast_mode)
+                                        future = helpers.submit(convert_one_file, name, data, fast_mode, converter)
+                                    futures_by_content[content_key] = future
+                                names_by_future.setdefault(future, []).append(name)
+                            last_update = 0.0
+                            done = 0
+                            for future in as_completed(names_by_future):
+                                for name in names_by_future[future]:
+                                    done += 1
+                                    try:
+                                        _, text = future.result()
+                                        
+                                        # Validate conversion
+                                        if not text or len(text.strip()) < 10:
+                                            text = f"# {name}\n\nDocument appears to be empty or corrupted."
+                                            processing_errors.append(f"⚠️ {name}: Content appears empty or corrupted")
+                                        
+                                        # Store content for preview, stats and the knowledge base
+                                        document_contents[name] = text
+                                        document_stats[name] = compute_stats(text)
+                                        file_meta[name] = describe_file(name)
+                                        
+                                    except Exception as e:
+                                        processing_errors.append(f"❌ {name}: {str(e)}")
+                                    
+                                    # Update progress at most 4 times a second (and always for the last file),
+                                    # with the message and the bar in ONE update
+                                    now = time.monotonic()
+                                    if now - last_update > 0.25 or done == total_files:
+                                        progress_bar.progress(done / total_files, text=f"🔄 Converted {name} ({done}/{total_files})")
+                                        last_update = now
+                        
+                        # 📋 Keep the files in the order they were uploaded
+                        processed_files = [name for name, _ in valid_files if name in document_contents]
+                        
+                        # 📚 Add ALL converted documents to ChromaDB in one batch
+                        # (Skipped when the saved collection already holds exactly these files)
+                        if processed_files and not already_indexed:
+                            status_text.text(f"📚 Adding {len(processed_files)} documents to knowledge base...")
                             try:
-                                # Update status with professional messaging
-                                status_text.text(f"🔄 Converting {file.name} to searchable format... ({idx + 1}/{total_files})")
-                                
-                                # Show loading animation for file processing
-                                show_loading_animation(f"Processing {file.name}...")
-                                
-                                # Create temporary file
-                                with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.name).suffix) as temp_file:
-                                    temp_file.write(file.getvalue())
-                                    temp_file_path = temp_file.name
-                                
-                                # Convert to markdown
-                                text = convert_to_markdown(temp_file_path)
-                                
-                                # Validate conversion
-                                if not text or len(text.strip()) < 10:
-                                    text = f"# {file.name}\n\nDocument appears to be empty or corrupted."
-                                    processing_errors.append(f"⚠️ {file.name}: Content appears empty or corrupted")
-                                
-                                # Store content for preview and stats
-                                document_contents[file.name] = text
-                                
-                                # Add to ChromaDB with error handling
-                                status_text.text(f"📚 Adding {file.name} to knowledge base...")
-                                show_loading_animation(f"Building knowledge base for {file.name}...")
-                                collection = add_text_to_chromadb(text, file.name, collection_name="uploaded_documents")
-                                processed_files.append(file.name)
-                                
-                                # Clean up temp file
-                                Path(temp_file_path).unlink(missing_ok=True)
-                                
+                                with show_loading_animation("Building knowledge base..."):
+                                    add_documents_to_chromadb(document_contents, collection)
+                                # 🏁 Only a box holding EVERY file may be reused next time
+                                if len(processed_files) == total_files:
+                                    mark_collection_complete("uploaded_documents", files_fingerprint)
                             except Exception as e:
-                                processing_errors.append(f"❌ {file.name}: {str(e)}")
-                                # Still clean up temp file if it exists
-                                try:
-                                    Path(temp_file_path).unlink(missing_ok=True)
-                                except:
-                                    pass
-                                continue
-                            
-                            # Update progress with smooth animation
-                            progress_bar.progress((idx + 1) / total_files)
+                                processing_errors.append(f"❌ Knowledge base: {str(e)}")
+                                # 🧹 Don't leave a half-filled box that looks finished
+                                collection = reset_collection(client, "uploaded_documents")
+                                processed_files = []
+                                document_contents = {}
+                                document_stats = {}
+                                file_meta = {}
                         
                         # Clear status text
                         status_text.text("✅ Processing complete!")
@@ -748,11 +1405,21 @@ def create_tabbed_interface():
                         # Update session state
                         st.session_state.collection = collection
                         st.session_state.uploaded_files_processed = processed_files
-                        st.session_state.document_contents = document_contents
+                        # (Only a short preview stays in the session; the full text waits on disk for downloads)
+                        st.session_state.document_contents = {
+                            name: {
+                                "preview": text[:800] + "..." if len(text) > 800 else text,
+                                "text_key": save_document_text(text)
+                            }
+                            for name, text in document_contents.items()
+                        }
+                        st.session_state.document_stats = document_stats
+                        st.session_state.file_meta = file_meta
+                        st.session_state.semantic_cache = []  # Old answers may not match the new documents
                         
                         # Enhanced success message with stats
                         if processed_files:
-                            total_words = sum(len(document_contents[filename].split()) for filename in processed_files)
+                            total_words = sum(document_stats[filename]["words"] for filename in processed_files)
                             
                             st.success(f"✅ Successfully processed {len(processed_files)} documents!")
                             
@@ -773,9 +1440,10 @@ def create_tabbed_interface():
                             
                             # List processed files
                             with st.expander("📋 View processed files", expanded=False):
-                                for filename in processed_files:
-                                    word_count = len(document_contents[filename].split())
-                                    st.markdown(f"• **{filename}** - {word_count:,} words")
+                                st.markdown("\n".join(
+                                    f"- **{filename}** - {document_stats[filename]['words']:,} words"
+                                    for filename in processed_files
+                                ))
                         else:
                             st.error("❌ No documents were successfully processed.")
             else:
@@ -815,13 +1483,15 @@ def create_tabbed_interface():
             if search_clicked and question.strip():
                 with st.container():
                     # Enhanced loading animation for AI processing
-                    show_loading_animation("🧠 Analyzing your documents...")
-                    
-                    # Professional loading state
-                    with st.spinner("🧠 Analyzing your documents..."):
+                    with show_loading_animation("🧠 Analyzing your documents..."):
                         try:
                             # Use enhanced answer function with source tracking
-                            answer, source = get_answer_with_source(st.session_state.collection, question)
+                            answer, source = cached_answer(
+                                st.session_state.collection,
+                                str(st.session_state.collection.id),
+                                question.strip().lower(),
+                                question
+                            )
                             
                             # Professional answer display
                             st.markdown("---")
@@ -934,19 +1604,15 @@ def create_tabbed_interface():
         st.markdown("#### 🔍 Detailed Diagnostics")
         with st.expander("View Detailed System Check", expanded=False):
             try:
-                import platform
-                import psutil
+                if psutil is None:
+                    raise ImportError("psutil is not installed")
                 
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.markdown("**System Info:**")
-                    if platform:
-                        st.write(f"• Platform: {platform.system()} {platform.release()}")
-                        st.write(f"• Python: {platform.python_version()}")
-                    else:
-                        st.write("• Platform: Information unavailable")
-                        st.write("• Python: Information unavailable")
+                    st.write(f"• Platform: {PLATFORM_INFO[0]} {PLATFORM_INFO[1]}")
+                    st.write(f"• Python: {PLATFORM_INFO[2]}")
                     st.write(f"• Streamlit: {st.__version__}")
                 
                 with col2:
@@ -954,7 +1620,7 @@ def create_tabbed_interface():
                     memory = psutil.virtual_memory()
                     st.write(f"• Memory Usage: {memory.percent}%")
                     st.write(f"• Available Memory: {memory.available // (1024**3)} GB")
-                    st.write(f"• CPU Usage: {psutil.cpu_percent()}%")
+                    st.write(f"• CPU Usage: {psutil.cpu_percent(interval=None)}%")  # Since the last reading (or app start) - never waits
                     
             except ImportError:
                 st.write("Install `psutil` and `platform` for detailed system diagnostics")
@@ -962,22 +1628,31 @@ def create_tabbed_interface():
                 st.write(f"System diagnostics unavailable: {e}")
 
 # HEALTH CHECK SYSTEM
+@st.cache_data(ttl=30, show_spinner=False)
+def check_chroma_heartbeat() -> str:
+    """💓 Pings the database (remembered for 30 seconds) - gives back what's wrong, or "" if it's fine"""
+    try:
+        get_chroma_client().heartbeat()
+        return ""
+    except Exception as e:
+        return str(e)
+
+
 def check_system_health():
     """Check system health and display issues if any"""
     health_issues = []
     
-    # Check ChromaDB
-    try:
-        client = chromadb.Client()
-        client.heartbeat()
-    except Exception as e:
-        health_issues.append(f"ChromaDB: {str(e)}")
+    # Check ChromaDB (pinged at most every 30 seconds)
+    chroma_problem = check_chroma_heartbeat()
+    if chroma_problem:
+        health_issues.append(f"ChromaDB: {chroma_problem}")
     
     # Check Transformers
     try:
-        from transformers import pipeline
-        # Quick test to see if model loading works
-        pipeline("text2text-generation", model="google/flan-t5-small")
+        # Cheap check that the library is there - loading the real brain here would take seconds
+        import transformers
+        if not hasattr(transformers, "pipeline"):
+            raise ImportError("transformers.pipeline is missing")
     except Exception as e:
         health_issues.append(f"Transformers/AI Model: {str(e)}")
     
@@ -995,6 +1670,8 @@ def check_system_health():
     
     return health_issues
 
+
+
 # MAIN APPLICATION
 def main():
     """
@@ -1019,318 +1696,13 @@ def main():
     )
     
     # 🎨 CUSTOM CSS - Make our app look absolutely beautiful!
-    st.markdown("""
-    <style>
-        /* 🌈 Beautiful background */
-        .stApp, .stApp > header, .stApp > div, body {
-            background-image: url('https://i.imgur.com/11gXpUI.png') !important;
-            background-size: cover !important;
-            background-position: center !important;
-            background-repeat: no-repeat !important;
-            background-attachment: fixed !important;
-        }
-        
-        /* Main container with glass morphism effect */
-        .main .block-container,
-        .stMainBlockContainer,
-        [data-testid="stMainBlockContainer"],
-        .main > div,
-        .block-container {
-            background: rgba(255, 255, 255, 0.55) !important;
-            backdrop-filter: blur(10px) !important;
-            padding: 2rem !important;
-            border-radius: 20px !important;
-            margin: 2rem auto !important;
-            max-width: 900px !important;
-            box-shadow: 0 15px 35px rgba(0,0,0,0.2) !important;
-            border: 1px solid rgba(255, 255, 255, 0.3) !important;
-        }
-        
-        /* Professional Typography */
-        .stApp *, 
-        .stApp p, 
-        .stApp div, 
-        .stApp span, 
-        .stApp h1, 
-        .stApp h2, 
-        .stApp h3,
-        .stApp label {
-            color: #2c3e50 !important;
-            font-family: 'Segoe UI', 'Roboto', sans-serif !important;
-        }
-        
-        /* Professional Input Styling */
-        .stTextInput input {
-            background: white !important;
-            color: #2c3e50 !important;
-            border: 2px solid #e5e7eb !important;
-            border-radius: 10px !important;
-            padding: 12px !important;
-            font-size: 16px !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .stTextInput input:focus {
-            border-color: #3b82f6 !important;
-            box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1) !important;
-        }
-        
-        /* Enhanced Button Styling - Primary buttons with maximum specificity */
-        div.stButton > button:first-child,
-        div.stButton > button[kind="primary"],
-        div.stButton > button[data-testid="baseButton-primary"],
-        .stButton > button,
-        button[kind="primary"] {
-            background: linear-gradient(45deg, #3b82f6, #1d4ed8) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 10px !important;
-            padding: 12px 24px !important;
-            font-size: 16px !important;
-            font-weight: 600 !important;
-            transition: all 0.3s ease !important;
-            box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3) !important;
-        }
-        
-        /* Force white text on ALL button content */
-        div.stButton > button:first-child *,
-        div.stButton > button[kind="primary"] *,
-        div.stButton > button[data-testid="baseButton-primary"] *,
-        .stButton > button *,
-        button[kind="primary"] *,
-        div.stButton > button span,
-        div.stButton > button p {
-            color: white !important;
-        }
-        
-        div.stButton > button:first-child:hover,
-        div.stButton > button[kind="primary"]:hover,
-        div.stButton > button[data-testid="baseButton-primary"]:hover,
-        .stButton > button:hover,
-        button[kind="primary"]:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 6px 20px rgba(59, 130, 246, 0.4) !important;
-            color: white !important;
-        }
-        
-        /* Ensure hover state text remains white */
-        div.stButton > button:hover *,
-        button[kind="primary"]:hover * {
-            color: white !important;
-        }
-        
-        /* Professional Tab Styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 12px !important;
-            background: rgba(248, 250, 252, 0.8) !important;
-            padding: 8px !important;
-            border-radius: 12px !important;
-            margin-bottom: 20px !important;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            background: rgba(255, 255, 255, 0.7) !important;
-            border-radius: 8px !important;
-            color: #64748b !important;
-            font-weight: 600 !important;
-            padding: 12px 20px !important;
-            border: 1px solid rgba(203, 213, 225, 0.5) !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background: linear-gradient(45deg, #3b82f6, #1d4ed8) !important;
-            color: white !important;
-            border-color: transparent !important;
-            box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3) !important;
-        }
-        
-        /* Force white text on ALL content within active tab */
-        .stTabs [aria-selected="true"] *,
-        .stTabs [aria-selected="true"] span,
-        .stTabs [aria-selected="true"] p,
-        .stTabs [aria-selected="true"] div {
-            color: white !important;
-        }
-        
-        /* Professional Cards for Content */
-        .stExpander {
-            background: rgba(255, 255, 255, 0.9) !important;
-            border-radius: 12px !important;
-            border: 1px solid rgba(203, 213, 225, 0.3) !important;
-            margin: 10px 0 !important;
-        }
-        
-        /* Enhanced Metrics */
-        [data-testid="metric-container"] {
-            background: rgba(255, 255, 255, 0.9) !important;
-            border-radius: 12px !important;
-            padding: 16px !important;
-            border: 1px solid rgba(203, 213, 225, 0.3) !important;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.05) !important;
-        }
-        
-        /* Success/Error Messages Enhancement */
-        .stSuccess {
-            background: rgba(34, 197, 94, 0.1) !important;
-            border-left: 4px solid #22c55e !important;
-            border-radius: 8px !important;
-        }
-        
-        .stError {
-            background: rgba(239, 68, 68, 0.1) !important;
-            border-left: 4px solid #ef4444 !important;
-            border-radius: 8px !important;
-        }
-        
-        .stInfo {
-            background: rgba(59, 130, 246, 0.1) !important;
-            border-left: 4px solid #3b82f6 !important;
-            border-radius: 8px !important;
-        }
-        
-        /* Download Button Special Styling */
-        .stDownloadButton > button {
-            background: linear-gradient(45deg, #10b981, #059669) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 8px !important;
-            padding: 8px 16px !important;
-            font-size: 14px !important;
-            font-weight: 500 !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .stDownloadButton > button:hover {
-            transform: translateY(-1px) !important;
-            box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3) !important;
-        }
-        
-        /* Loading Spinner Enhancement */
-        .stSpinner {
-            border-color: #3b82f6 !important;
-        }
-        
-        /* Professional Footer */
-        .footer-style {
-            text-align: center;
-            padding: 30px 20px;
-            color: #64748b;
-            font-size: 14px;
-            border-top: 2px solid rgba(203, 213, 225, 0.2);
-            margin-top: 40px;
-            background: rgba(248, 250, 252, 0.5);
-            border-radius: 12px;
-        }
-        
-        /* Enhanced spacing for better visual hierarchy */
-        .stTabs [data-baseweb="tab-panel"] {
-            padding-top: 20px !important;
-        }
-        
-        /* Improved section headers */
-        .stApp h3 {
-            border-bottom: 2px solid rgba(59, 130, 246, 0.2) !important;
-            padding-bottom: 8px !important;
-            margin-bottom: 20px !important;
-        }
-        
-        /* Enhanced file uploader styling */
-        .stFileUploader {
-            border: 2px dashed rgba(59, 130, 246, 0.3) !important;
-            border-radius: 12px !important;
-            padding: 20px !important;
-            background: rgba(59, 130, 246, 0.02) !important;
-        }
-    </style>
-    
-    <script>
-    // Aggressively ensure button text is white - fallback JavaScript solution
-    function ensureButtonStyling() {
-        // Find ALL buttons and make them properly styled
-        const allButtons = document.querySelectorAll('button');
-        allButtons.forEach(button => {
-            // Check if it's a primary button or contains "Process Documents"
-            const isPrimary = button.getAttribute('kind') === 'primary' || 
-                            button.hasAttribute('data-testid') && button.getAttribute('data-testid').includes('baseButton-primary') ||
-                            button.textContent.includes('Process Documents') ||
-                            button.textContent.includes('Search & Answer');
-            
-            if (isPrimary) {
-                button.style.setProperty('color', 'white', 'important');
-                button.style.setProperty('background', 'linear-gradient(45deg, #3b82f6, #1d4ed8)', 'important');
-                
-                // Force ALL child elements to have white text
-                const allChildElements = button.querySelectorAll('*');
-                allChildElements.forEach(child => {
-                    child.style.setProperty('color', 'white', 'important');
-                });
-                
-                // Also target text nodes directly
-                const walker = document.createTreeWalker(
-                    button,
-                    NodeFilter.SHOW_TEXT,
-                    null,
-                    false
-                );
-                
-                let textNode;
-                while (textNode = walker.nextNode()) {
-                    if (textNode.parentElement) {
-                        textNode.parentElement.style.setProperty('color', 'white', 'important');
-                    }
-                }
-            }
-        });
-        
-        // Extra safety - target by common Streamlit button selectors
-        const streamlitButtons = document.querySelectorAll('div.stButton > button, .stButton button');
-        streamlitButtons.forEach(button => {
-            if (button.textContent.includes('Process Documents') || button.textContent.includes('Search & Answer')) {
-                button.style.setProperty('color', 'white', 'important');
-                button.style.setProperty('background', 'linear-gradient(45deg, #3b82f6, #1d4ed8)', 'important');
-                
-                const allChildren = button.querySelectorAll('*');
-                allChildren.forEach(child => {
-                    child.style.setProperty('color', 'white', 'important');
-                });
-            }
-        });
-        
-        // Force white text on active tabs
-        const activeTabs = document.querySelectorAll('.stTabs [aria-selected="true"]');
-        activeTabs.forEach(tab => {
-            tab.style.setProperty('color', 'white', 'important');
-            
-            // Force all child elements to have white text
-            const allTabChildren = tab.querySelectorAll('*');
-            allTabChildren.forEach(child => {
-                child.style.setProperty('color', 'white', 'important');
-            });
-        });
-    }
-    
-    // Run immediately
-    ensureButtonStyling();
-    
-    // Use MutationObserver to catch dynamically added buttons
-    const observer = new MutationObserver(function(mutations) {
-        mutations.forEach(function(mutation) {
-            if (mutation.type === 'childList') {
-                ensureButtonStyling();
-            }
-        });
-    });
-    observer.observe(document.body, { childList: true, subtree: true });
-    
-    // Run periodically to catch any missed elements
-    setInterval(ensureButtonStyling, 500);
-    </script>
-    """, unsafe_allow_html=True)
+    # (This app's background lives in static/finalapp8.css; everything else is shared with the other apps)
+    inject_styles("finalapp8.css", "shared.css")
 
     # Professional Header with Logo
-    col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
-    with col3:
+    # 📐 3 columns (wide-narrow-wide) center the logo with fewer empty boxes than 5
+    left, middle, right = st.columns([2, 1, 2])
+    with middle:
         try:
             st.image("logo.png", width=120)
         except:
@@ -1360,20 +1732,21 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
-    # 🚀 Show startup loading animation
-    if 'app_initialized' not in st.session_state:
-        show_loading_animation("🏠 Setting up DocLens...")
-        st.session_state.app_initialized = True
-
     # Initialize session state
     if "collection" not in st.session_state:
         st.session_state.collection = None  # Where we store our document
     if "uploaded_files_processed" not in st.session_state:
         st.session_state.uploaded_files_processed = []  # List of files we've successfully processed
     if "document_contents" not in st.session_state:
-        st.session_state.document_contents = {}  # The actual text from each document
+        st.session_state.document_contents = {}  # A preview of each document + where its full text is saved
+    if "document_stats" not in st.session_state:
+        st.session_state.document_stats = {}  # Word and size counts for each document
+    if "file_meta" not in st.session_state:
+        st.session_state.file_meta = {}  # Name, type, icon and color for each document
     if "search_history" not in st.session_state:
         st.session_state.search_history = []  # Memory of all questions and answers
+    if "semantic_cache" not in st.session_state:
+        st.session_state.semantic_cache = []  # Recent answers we can reuse for similar questions
 
     # 📱 Create the main app with all its tabs and features
     create_tabbed_interface()
@@ -1387,7 +1760,7 @@ def main():
                 🤖 AI-Powered
             </span>
             <span style="background: rgba(16, 185, 129, 0.1); padding: 4px 12px; border-radius: 20px; font-size: 12px;">
-                🔒 Privacy-First
+                💾 Cached on this server
             </span>
             <span style="background: rgba(147, 51, 234, 0.1); padding: 4px 12px; border-radius: 20px; font-size: 12px;">
                 ⚡ Real-time
@@ -1451,9 +1824,13 @@ def main():
             - **Embeddings:** SentenceTransformers for document understanding
             
             **🌐 Deployment:**
-            - **Cloud Ready:** Compatible with Streamlit Cloud, no file system dependencies
+            - **Cloud Ready:** Compatible with Streamlit Cloud (needs a writable home folder for its cache)
             - **Cross-Platform:** Works on Windows, Mac, and Linux
-            - **Privacy First:** In-memory processing, no permanent file storage
+            - **Stored on Disk:** Converted text, full document text, embeddings and the ChromaDB index are
+              saved on the server in `~/.cache/streamlitai`, so repeat uploads are instant. They survive
+              restarts and are shared by everyone using the same server. Saved conversions and embeddings
+              are trimmed to about 1 GB, oldest first (full document text is kept for downloads);
+              delete that folder to remove everything
             - **Real-time:** Instant document processing and question answering
             """)
 
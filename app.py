@@ -10,101 +10,233 @@ except ImportError:
 # Students: Replace the documents below with your own!
 
 # IMPORTS - These are the libraries we need
+from collections import OrderedDict  # A dictionary that remembers which answer was used last
+from pathlib import Path        # Helps us work with file paths
+from threading import Lock, Thread  # Lets the AI model write while we show its words (and keeps visitors from clashing)
+import hashlib                  # Makes "fingerprints" of text so we can spot changes
 import streamlit as st          # Creates web interface components
 import chromadb                # Stores and searches through documents  
-from transformers import pipeline  # AI model for generating answers
+from transformers import pipeline, TextIteratorStreamer  # AI model for generating answers (word by word)
+from sentence_transformers import SentenceTransformer  # Turns text into numbers (embeddings)
+from styles import inject_styles  # Adds our shared CSS to the page
 
+# Where the document database lives on disk (in your user cache folder, not next to the code),
+# so it survives app restarts without filling up the project folder
+CACHE_DIR = Path.home() / ".cache" / "streamlitai"
+CHROMA_DIR = CACHE_DIR / "app-chroma"
+
+# STUDENT TASK: Replace these 5 documents with your own!
+# Pick ONE topic: movies, sports, cooking, travel, technology
+# Each document should be 150-200 words
+# IMPORTANT: The quality of your documents affects answer quality!
+# (A tuple of plain text is stored ready-made inside the program, so reruns don't rebuild it -
+#  and nobody can change it by accident)
+MY_DOCUMENTS = (
+    """Europe’s Historic Landmarks and Heritage: Europe is a treasure of historical landmarks and cultural heritage. From ancient ruins to medieval castles, the continent showcases thousands of years of history. Many sites are protected on UNESCO’s World Heritage List for their “outstanding universal value”. In fact, Italy leads the world with 60 UNESCO World Heritage Sites, more than any other country. Each year new locations are added, highlighting Europe’s ongoing commitment to preserving its past. For example, in 2024 UNESCO recognized the ancient Via Appia in Italy and the 19th-century Schwerin Castle ensemble in Germany. Europe’s heritage isn’t limited to monuments; it also includes cultural landscapes like Scotland’s Flow Country peatlands, one of the world’s largest carbon-rich bogs now on the heritage list. These landmarks and landscapes attract millions of visitors, allowing travellers to step back in time and experience Europe’s rich tapestry of civilizations and traditions. Whether exploring the Acropolis in Athens or a newly inscribed site in Eastern Europe, travellers can witness firsthand how Europe’s history is carefully preserved and celebrated for future generations.""",
+    """European Culinary Traditions and Cuisine: European cuisine is as diverse as its cultures, with each region offering unique culinary traditions passed down through generations. Food it’s a key part of cultural identity and social life. Several European food practices are recognized by UNESCO as intangible cultural heritage. For example, the Mediterranean diet (practiced in countries like Italy, Greece, Spain, and Croatia) is on UNESCO’s heritage list, encompassing traditional knowledge from harvesting crops to sharing meals. Italy’s Neapolitan pizza-making is considered an art; the skill of the pizzaiuolo (pizza maker) in Naples, has UNESCO recognition for its cultural significance. Belgium’s beer culture, with thousands of beer varieties and centuries-old brewing traditions is another UNESCO-listed practice. France is famed for its cheeses, and the gastronomic meal of the French is world-renowned, while Spain’s tapas culture and Scandinavia’s foraging-inspired New Nordic cuisine have gained global attention. These culinary traditions make Europe a place for food lovers. Travelers can sample, experiencing how food and culture blend in each locale. The continent’s commitment to its food heritage ensures that classic recipes and food rituals remain a vibrant part of modern life, even as new gastronomic trends emerge.""",
+    """Travel Trends and Popular Destinations in Europe: Travel in Europe is booming with tourism. Europeans themselves are eager travellers: 73% of Europeans planned trips between late 2024 and early 2025, a jump of 6% compared to the previous year. Traditional destinations remain highly popular. Spain and France were each the top choice for 7% of surveyed European travellers (with Italy close behind at 6%). Major cities continue to draw crowds, and iconic attractions such as the Eiffel Tower or Colosseum are as beloved as ever. Many tourists are looking beyond the hotspots: over half of European travellers (51%) now express interest in visiting lesser-known spots within popular countries, aiming to avoid crowds. Younger generations are searching these “hidden gem” destinations off the usual tourist trail. This means a rise in visits to smaller towns, rural regions, and second-tier cities that offer rich culture. Another trend is the blending of work and travel with about 1 in 5 Europeans planning a trip that combines business and leisure. Travelers are also increasingly conscious of sustainability and authentic experiences, leading to more interest in local culture, food, and community interactions. All these trends indicate that travel patterns are diversifying.""",
+    """Festivals and Cultural Events in Europe: European festivals often feature historic dress and community celebrations. Europe hosts many festivals and cultural events, everything from ancient traditions to modern arts. Here are a few of Europe’s most iconic festivals:Carnival of Venice: Venice is transformed by this masquerade festival. Visitors wear elegant masks and elaborate costumes. San Fermín: This festival, known for the Running of the Bulls, where brave (or reckless) participants sprint ahead of bulls through the streets. Oktoberfest: Late September to early October means Oktoberfest, the world’s largest beer festival. What began as a Bavarian royal wedding celebration has evolved into a two-week folk festival attracting millions of visitors from around the globe. Edinburgh Festival Fringe: The world’s largest arts festival, turning the entire city into a stage. Thousands of performers present shows ranging from stand-up comedy and theater to dance, music, and spoken word. La Tomatina: Is essentially the world’s biggest food fight. The celebration continues with music and dancing. Europe’s calendar is filled with events like Ireland’s St. Patrick’s Day parades, France’s Cannes Film Festival, Austria’s classical Salzburg Festival, and so many more. Just remember to plan, as popular events can mean crowded cities and booked-out accommodations.""",
+    """Travel Tips and Sustainable Tourism in Europe: Traveling in Europe can be enriching and enjoyable. Here are some tips and trends for a smooth travel: Travel Off-Season to Avoid Crowds: Popular destinations in Europe are very crowded in peak summer months. Consider visiting in other seasons. Cities are encouraging off-peak travel. You’ll not only find fewer tourists but also cheaper prices and a warmer welcome from locals. Explore Lesser-Known Destinations: Include some “hidden gems” in your itinerary. Smaller towns and less-touristed regions also offer experiences and reduce overtourism in hotspots. Use Trains and Public Transportation: Europe’s transportation network is excellent and environmentally friendly. It has a well-developed rail system that’s scenic. High-speed trains connect major cities, and sleeper trains mean saving time and hotel costs. Respect Local Culture and Rules: Learn a bit of the basics of the local language as a courtesy. Follow dress codes at religious and cultural sites. Be aware of local regulations for preserving communities. Some places limit the number of visitors at popular attractions or have rules to protect historic centers. Choose Sustainable Services: Support businesses with green certifications or community initiatives. Stay in family-run guesthouses or eco-certified hotels that invest in the local area."""
+)
+
+# A short "fingerprint" of the documents above - changing even one letter gives a new one,
+# so edited documents get a fresh database collection and old remembered answers are not reused
+CORPUS_FINGERPRINT = hashlib.sha256("\0".join(MY_DOCUMENTS).encode("utf-8")).hexdigest()[:16]
+
+# What we say when none of the documents match the question
+CANNOT_ANSWER = "I cannot answer this question with my knowledge."
+
+@st.cache_resource
+def get_encoder():
+    """
+    This function loads the model that turns text into embeddings
+    It is the same all-MiniLM-L6-v2 model ChromaDB uses by default,
+    but loading it ourselves lets us embed all documents in ONE batch
+    """
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+@st.cache_resource
+def get_client():
+    """
+    This function opens our document database on disk (in the CHROMA_DIR folder)
+    Because it is saved on disk, the documents are still there after the app restarts
+    """
+    return chromadb.PersistentClient(path=str(CHROMA_DIR))
+
+@st.cache_resource
 def setup_documents():
     """
     This function creates our document database
-    NOTE: This runs every time someone uses the app
-    In a real app, you'd want to save this data permanently
+    NOTE: @st.cache_resource means this only runs ONCE per app process -
+    every rerun after that gets the same ready-made collection back
+    The database is saved on disk, so after a restart the documents are already there
     """
-    client = chromadb.Client()
+    client = get_client()
+    # The fingerprint is part of the name, so changed documents get a fresh collection
+    collection_name = f"docs_{CORPUS_FINGERPRINT}"
     try:
-        collection = client.get_collection(name="docs")
+        collection = client.get_collection(name=collection_name)
     except Exception:
-        collection = client.create_collection(name="docs")
-    
-    # STUDENT TASK: Replace these 5 documents with your own!
-    # Pick ONE topic: movies, sports, cooking, travel, technology
-    # Each document should be 150-200 words
-    # IMPORTANT: The quality of your documents affects answer quality!
-    
-    my_documents = [
-        """Europe’s Historic Landmarks and Heritage: Europe is a treasure of historical landmarks and cultural heritage. From ancient ruins to medieval castles, the continent showcases thousands of years of history. Many sites are protected on UNESCO’s World Heritage List for their “outstanding universal value”. In fact, Italy leads the world with 60 UNESCO World Heritage Sites, more than any other country. Each year new locations are added, highlighting Europe’s ongoing commitment to preserving its past. For example, in 2024 UNESCO recognized the ancient Via Appia in Italy and the 19th-century Schwerin Castle ensemble in Germany. Europe’s heritage isn’t limited to monuments; it also includes cultural landscapes like Scotland’s Flow Country peatlands, one of the world’s largest carbon-rich bogs now on the heritage list. These landmarks and landscapes attract millions of visitors, allowing travellers to step back in time and experience Europe’s rich tapestry of civilizations and traditions. Whether exploring the Acropolis in Athens or a newly inscribed site in Eastern Europe, travellers can witness firsthand how Europe’s history is carefully preserved and celebrated for future generations.""",
-        """European Culinary Traditions and Cuisine: European cuisine is as diverse as its cultures, with each region offering unique culinary traditions passed down through generations. Food it’s a key part of cultural identity and social life. Several European food practices are recognized by UNESCO as intangible cultural heritage. For example, the Mediterranean diet (practiced in countries like Italy, Greece, Spain, and Croatia) is on UNESCO’s heritage list, encompassing traditional knowledge from harvesting crops to sharing meals. Italy’s Neapolitan pizza-making is considered an art; the skill of the pizzaiuolo (pizza maker) in Naples, has UNESCO recognition for its cultural significance. Belgium’s beer culture, with thousands of beer varieties and centuries-old brewing traditions is another UNESCO-listed practice. France is famed for its cheeses, and the gastronomic meal of the French is world-renowned, while Spain’s tapas culture and Scandinavia’s foraging-inspired New Nordic cuisine have gained global attention. These culinary traditions make Europe a place for food lovers. Travelers can sample, experiencing how food and culture blend in each locale. The continent’s commitment to its food heritage ensures that classic recipes and food rituals remain a vibrant part of modern life, even as new gastronomic trends emerge.""",
-        """Travel Trends and Popular Destinations in Europe: Travel in Europe is booming with tourism. Europeans themselves are eager travellers: 73% of Europeans planned trips between late 2024 and early 2025, a jump of 6% compared to the previous year. Traditional destinations remain highly popular. Spain and France were each the top choice for 7% of surveyed European travellers (with Italy close behind at 6%). Major cities continue to draw crowds, and iconic attractions such as the Eiffel Tower or Colosseum are as beloved as ever. Many tourists are looking beyond the hotspots: over half of European travellers (51%) now express interest in visiting lesser-known spots within popular countries, aiming to avoid crowds. Younger generations are searching these “hidden gem” destinations off the usual tourist trail. This means a rise in visits to smaller towns, rural regions, and second-tier cities that offer rich culture. Another trend is the blending of work and travel with about 1 in 5 Europeans planning a trip that combines business and leisure. Travelers are also increasingly conscious of sustainability and authentic experiences, leading to more interest in local culture, food, and community interactions. All these trends indicate that travel patterns are diversifying.""",
-        """Festivals and Cultural Events in Europe: European festivals often feature historic dress and community celebrations. Europe hosts many festivals and cultural events, everything from ancient traditions to modern arts. Here are a few of Europe’s most iconic festivals:Carnival of Venice: Venice is transformed by this masquerade festival. Visitors wear elegant masks and elaborate costumes. San Fermín: This festival, known for the Running of the Bulls, where brave (or reckless) participants sprint ahead of bulls through the streets. Oktoberfest: Late September to early October means Oktoberfest, the world’s largest beer festival. What began as a Bavarian royal wedding celebration has evolved into a two-week folk festival attracting millions of visitors from around the globe. Edinburgh Festival Fringe: The world’s largest arts festival, turning the entire city into a stage. Thousands of performers present shows ranging from stand-up comedy and theater to dance, music, and spoken word. La Tomatina: Is essentially the world’s biggest food fight. The celebration continues with music and dancing. Europe’s calendar is filled with events like Ireland’s St. Patrick’s Day parades, France’s Cannes Film Festival, Austria’s classical Salzburg Festival, and so many more. Just remember to plan, as popular events can mean crowded cities and booked-out accommodations.""",
-        """Travel Tips and Sustainable Tourism in Europe: Traveling in Europe can be enriching and enjoyable. Here are some tips and trends for a smooth travel: Travel Off-Season to Avoid Crowds: Popular destinations in Europe are very crowded in peak summer months. Consider visiting in other seasons. Cities are encouraging off-peak travel. You’ll not only find fewer tourists but also cheaper prices and a warmer welcome from locals. Explore Lesser-Known Destinations: Include some “hidden gems” in your itinerary. Smaller towns and less-touristed regions also offer experiences and reduce overtourism in hotspots. Use Trains and Public Transportation: Europe’s transportation network is excellent and environmentally friendly. It has a well-developed rail system that’s scenic. High-speed trains connect major cities, and sleeper trains mean saving time and hotel costs. Respect Local Culture and Rules: Learn a bit of the basics of the local language as a courtesy. Follow dress codes at religious and cultural sites. Be aware of local regulations for preserving communities. Some places limit the number of visitors at popular attractions or have rules to protect historic centers. Choose Sustainable Services: Support businesses with green certifications or community initiatives. Stay in family-run guesthouses or eco-certified hotels that invest in the local area."""
-    ]
+        collection = client.create_collection(name=collection_name)
     
     # Add documents to database with unique IDs
     # ChromaDB needs unique identifiers for each document
-    collection.add(
-        documents=my_documents,
-        ids=["doc1", "doc2", "doc3", "doc4", "doc5"]
-    )
+    # Only add them if the collection is empty, so we never embed the same documents twice
+    if collection.count() == 0:
+        # Embed all documents in a single batched pass instead of one at a time
+        embeddings = get_encoder().encode(
+            list(MY_DOCUMENTS),
+            batch_size=len(MY_DOCUMENTS),
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        collection.add(
+            documents=list(MY_DOCUMENTS),
+            embeddings=embeddings.tolist(),
+            ids=["doc1", "doc2", "doc3", "doc4", "doc5"]
+        )
     
     return collection
 
-def get_answer(collection, question):
+@st.cache_resource
+def get_model():
     """
-    This function searches documents and generates answers while minimizing hallucination
+    This function loads the AI model that writes our answers
+    NOTE: @st.cache_resource means the model is only loaded ONCE per app process,
+    so every question after the first one skips reading ~300MB from disk
+    The model's Linear layers are shrunk to int8 numbers, which runs about
+    2x faster on a CPU - if that fails we just use the normal model
+    """
+    try:
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+        model = AutoModelForSeq2SeqLM.from_pretrained("google/flan-t5-small")
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        tokenizer = AutoTokenizer.from_pretrained("google/flan-t5-small")
+        return pipeline("text2text-generation", model=model, tokenizer=tokenizer)
+    except Exception:
+        return pipeline("text2text-generation", model="google/flan-t5-small")
+
+def build_prompt(question, docs, distances):
+    """
+    This function turns the search results for one question into a prompt for the AI model
+    It gives back None when no document is relevant enough to answer from
     """
-    
-    # STEP 1: Search for relevant documents in the database
-    # We get 3 documents instead of 2 for better context coverage
-    results = collection.query(
-        query_texts=[question],    # The user's question
-        n_results=3               # Get 3 most similar documents
-    )
-    
-    # STEP 2: Extract search results
-    # docs = the actual document text content
-    # distances = how similar each document is to the question (lower = more similar)
-    docs = results["documents"][0]
-    distances = results["distances"][0]
     
     # STEP 3: Check if documents are actually relevant to the question
     # If no documents found OR all documents are too different from question
-    # Return early to avoid hallucination
-    if not docs or min(distances) > 1.5:  # 1.5 is similarity threshold - adjust as needed
-        return "I cannot answer this question with my knowledge."
+    # Return early to avoid hallucination (and skip the slow AI model entirely)
+    if not docs:
+        return None
+    best = min(distances)
+    if best > 1.2:  # 1.2 is similarity threshold - adjust as needed
+        return None
+    
+    # Keep only documents almost as close as the best one
+    # A shorter prompt means less text for the AI model to read = faster answers
+    docs = [doc for doc, distance in zip(docs, distances) if distance <= best + 0.2]
     
     # STEP 4: Create structured context for the AI model
     # Format each document clearly with labels
     # This helps the AI understand document boundaries
-    context = "\n\n".join([f"Document {i+1}: {doc}" for i, doc in enumerate(docs)])
+    # The pieces are collected in one list and glued together ONCE at the end,
+    # so the long document texts are copied a single time instead of three
+    parts = ["Context information:\n"]
+    append = parts.append
+    for i, doc in enumerate(docs, start=1):
+        append("Document ")
+        append(str(i))
+        append(": ")
+        append(doc)
+        append("\n\n")
     
     # STEP 5: Build improved prompt to reduce hallucination
     # Key changes from original:
     # - Separate context from instructions
     # - More explicit instructions about staying within context
     # - Clear format structure
-    prompt = f"""Context information:
-{context}
-
-Question: {question}
+    append("Question: ")
+    append(question)
+    append("""
 
 Instructions: Answer ONLY using the information provided above. If the answer is not in the context, respond with "I don't know." Do not add information from outside the context.
 
-Answer:"""
+Answer:""")
+    return "".join(parts)
+
+def stream_answer(collection, question):
+    """
+    This function answers one question but hands back the answer word by word
+    The first words can be shown while the AI model is still writing the rest
+    """
+    
+    # STEP 1: Search for relevant documents in the database
+    # We get 3 documents instead of 2 for better context coverage
+    # The question must be embedded with the same encoder as the documents
+    question_embedding = get_encoder().encode([question], normalize_embeddings=True)
+    results = collection.query(query_embeddings=question_embedding.tolist(), n_results=3)
+    
+    # STEP 2: Turn the search results into a prompt (steps 3-5 are in build_prompt)
+    prompt = build_prompt(question, results["documents"][0], results["distances"][0])
+    if prompt is None:
+        yield CANNOT_ANSWER
+        return
     
     # STEP 6: Generate answer with anti-hallucination parameters
-    ai_model = pipeline("text2text-generation", model="google/flan-t5-small")
-    response = ai_model(
-        prompt, 
-        max_length=150
-    )
+    # The model writes in a background thread and drops each new piece into the streamer
+    ai_model = get_model()
+    streamer = TextIteratorStreamer(ai_model.tokenizer, skip_special_tokens=True)
+    inputs = ai_model.tokenizer(prompt, return_tensors="pt", truncation=True, max_length=512)
+    errors = []
     
-    # STEP 7: Extract and clean the generated answer
-    answer = response[0]['generated_text'].strip()
+    def generate():
+        try:
+            ai_model.model.generate(
+                **inputs,
+                streamer=streamer,
+                max_new_tokens=80,   # Limit only the answer length, not prompt + answer
+                num_beams=1,         # Greedy decoding: follow one best guess instead of several
+                do_sample=False      # No randomness - same question, same answer
+            )
+        except Exception as error:
+            # Close the streamer ourselves, otherwise the loop below would wait for words forever
+            errors.append(error)
+            streamer.end()
     
+    Thread(target=generate, daemon=True).start()
+    yield from streamer
+    if errors:
+        raise errors[0]  # Show the model's error on the page instead of a half-finished answer
 
-    
-    # STEP 8: Return the final answer
-    return answer
+@st.cache_resource
+def get_answer_memory():
+    """
+    This function gives back ONE shared notebook of answers for the whole app, and its lock
+    Asking the exact same question again returns instantly - no search, no AI model
+    Every visitor runs in their own thread, so the lock makes sure only one of them
+    reads or changes the notebook at a time
+    """
+    return OrderedDict(), Lock()
+
+def recall_answer(memory, lock, key):
+    """
+    This function looks up an answer we gave before (or None if the question is new)
+    """
+    with lock:
+        if key not in memory:
+            return None
+        memory.move_to_end(key)  # Recently used answers are kept the longest
+        return memory[key]
+
+def remember_answer(memory, lock, key, answer):
+    """
+    This function writes an answer into the notebook, keeping only the newest 256
+    """
+    with lock:
+        memory[key] = answer
+        memory.move_to_end(key)
+        if len(memory) > 256:
+            memory.popitem(last=False)  # Forget the answer that was used longest ago
 
 # MAIN APP STARTS HERE - This is where we build the user interface
 
@@ -116,64 +248,18 @@ st.set_page_config(
 )
 
 # CUSTOM CSS - FORCING THE STYLES
-st.markdown("""
-<style>
-    /* Force background image everywhere */
-    .stApp, .stApp > header, .stApp > div, body {
-        background: url("https://images.unsplash.com/photo-1467269204594-9661b134dd2b?ixlib=rb-4.0.3&auto=format&fit=crop&w=1920&q=80") center/cover no-repeat !important;
-        background-attachment: fixed !important;
-    }
-    
-    /* Target all possible container selectors */
-    .main .block-container,
-    .stMainBlockContainer,
-    [data-testid="stMainBlockContainer"],
-    .main > div,
-    .block-container {
-        background: #cbebe3 !important;
-        padding: 2rem !important;
-        border-radius: 20px !important;
-        margin: 2rem auto !important;
-        max-width: 900px !important;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.3) !important;
-        border: 2px solid #ddd !important;
-    }
-    
-    /* Force ALL text to be dark */
-    .stApp *, 
-    .stApp p, 
-    .stApp div, 
-    .stApp span, 
-    .stApp h1, 
-    .stApp h2, 
-    .stApp h3,
-    .stApp label {
-        color: #333333 !important;
-    }
-    
-    /* Title specific styling */
-    .stApp h1 {
-        color: #2c3e50 !important;
-        text-align: center !important;
-        font-weight: bold !important;
-    }
-    
-    /* Input field styling */
-    .stTextInput input {
-        background: white !important;
-        color: #333 !important;
-        border: 2px solid #ddd !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+# All styles live in static/app.css and are injected with ONE st.markdown call
+# (styles.py reads the file once per app process, not on every rerun)
+inject_styles("app.css")
 
 # STREAMLIT BUILDING BLOCK 0: LOGO
 # st.image() displays an image file
 # width parameter controls the size of the logo
 # Put your logo file (logo.png, logo.jpg, etc.) in the same folder as app.py
-# Using columns to center the logo within the white container - more to the right
-col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
-with col3:
+# Using columns to center the logo within the white container
+# 3 columns (wide-narrow-wide) center it just like 5 equal ones, with fewer empty boxes
+left, middle, right = st.columns([2, 1, 2])
+with middle:
     st.image("logo.png", width=150)
 
 # STREAMLIT BUILDING BLOCK 1: PAGE TITLE
@@ -190,7 +276,7 @@ st.write("🌟 Welcome to your ultimate European adventure companion! ✈️🗺
 
 # STREAMLIT BUILDING BLOCK 3: FUNCTION CALLS
 # We call our function to set up the document database
-# This happens every time someone uses the app
+# Thanks to caching, the documents are only embedded the first time
 collection = setup_documents()
 
 # STREAMLIT BUILDING BLOCK 4: TEXT INPUT BOX
@@ -200,26 +286,6 @@ collection = setup_documents()
 # - Users can click in this box and type their question
 question = st.text_input("Write your thoughts:")
 
-# CUSTOM CSS FOR BUTTON COLOR
-st.markdown("""
-<style>
-div.stButton > button:first-child {
-    background-color: #ffffff;
-    color: #2c3e50;
-    border: 2px solid #d1d5db;
-    border-radius: 20px;
-    padding: 0.5rem 1rem;
-    font-size: 16px;
-    font-weight: bold;
-}
-div.stButton > button:first-child:hover {
-    background-color: #f8f9fa;
-    color: #2c3e50;
-    border-color: #a0a0a0;
-}
-</style>
-""", unsafe_allow_html=True)
-
 # STREAMLIT BUILDING BLOCK 5: BUTTON
 # st.button() creates a clickable button
 # - When clicked, all code inside the 'if' block runs
@@ -231,22 +297,32 @@ if st.button("✈️", type="primary"):
     # Check if user actually typed something (not empty)
     if question:
         
-        # STREAMLIT BUILDING BLOCK 7: SPINNER (LOADING ANIMATION)
-        # st.spinner() shows a rotating animation while code runs
-        # - Text inside quotes appears next to the spinner
-        # - Everything inside the 'with' block runs while spinner shows
-        # - Spinner disappears when the code finishes
-        with st.spinner("Searching for the best travelling reccomendation for you..."):
-            answer = get_answer(collection, question)
-        
         # STREAMLIT BUILDING BLOCK 8: FORMATTED TEXT OUTPUT
         # st.write() can display different types of content
         # - **text** makes text bold (markdown formatting)
         # - First st.write() shows "Answer:" in bold
-        # - Second st.write() shows the actual answer
-        st.success("🎉 Found the perfect travel recommendation for you!")
+        # - st.write_stream() shows the answer word by word as the AI writes it
+        # - Questions asked before come straight from memory with st.write()
+        # - st.empty() keeps a spot at the top for the success message,
+        #   which is only filled in once the whole answer has been written
+        memory, memory_lock = get_answer_memory()
+        memory_key = (CORPUS_FINGERPRINT, question)
+        success_slot = st.empty()
         st.write("**🗺️ Here is the best answer to your question:**")
-        st.write(answer)
+        answer = recall_answer(memory, memory_lock, memory_key)
+        if answer is not None:
+            st.write(answer)
+        else:
+            # STREAMLIT BUILDING BLOCK 7: SPINNER (LOADING ANIMATION)
+            # st.spinner() shows a rotating animation while code runs
+            # - Text inside quotes appears next to the spinner
+            # - Everything inside the 'with' block runs while spinner shows
+            # - Spinner disappears when the code finishes
+            with st.spinner("Searching for the best travelling reccomendation for you..."):
+                answer = st.write_stream(stream_answer(collection, question))
+            remember_answer(memory, memory_lock, memory_key, answer)
+        if answer != CANNOT_ANSWER:
+            success_slot.success("🎉 Found the perfect travel recommendation for you!")
     
     else:
         # STREAMLIT BUILDING BLOCK 9: SIMPLE MESSAGE
@@ -1,176 +1,398 @@
 # Simple Q&A App using Streamlit
 # Students: Replace the documents below with your own!
 
-# Fix SQLite version issue for ChromaDB on Streamlit Cloud
-try:
-    __import__('pysqlite3')
-    import sys
-    sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
-except ImportError:
-    pass
-
-
 # IMPORTS - These are the libraries we need
+from collections import OrderedDict  # A dictionary that remembers which answer was used last
+from pathlib import Path        # Helps us work with file paths
+import hashlib                  # Makes "fingerprints" of text so we can spot changes
+import os                       # Tells us how many CPU cores the computer has
+import re                       # Finds patterns in text (like where a sentence ends)
+import threading                # Lets only one visitor at a time change the shared answer notebook
+import numpy as np              # Does fast math on big lists of numbers
 import streamlit as st          # Creates web interface components
-import chromadb                # Stores and searches through documents  
-from transformers import pipeline  # AI model for generating answers
+import torch                    # The engine that runs the AI model
+from transformers import AutoModelForQuestionAnswering, AutoTokenizer  # AI model for finding answers
+from sentence_transformers import SentenceTransformer  # Turns text into numbers (embeddings)
+
+# One PyTorch worker thread per CPU core, set before any model is loaded
+# (cheap to repeat, so it's fine that Streamlit runs this line again on every click)
+torch.set_num_threads(os.cpu_count() or 1)
+
+# Where we keep the document embeddings (and the sped-up AI model), so they are only worked out once
+CACHE_DIR = Path.home() / ".cache" / "streamlitai"
+
+# The AI model that finds answers, and where its ONNX (fast engine) version is saved
+QA_MODEL_NAME = "distilbert-base-cased-distilled-squad"
+QA_ONNX_DIR = CACHE_DIR / "distilbert-squad-onnx"
+
+# STUDENT TASK: Replace these 5 documents with your own!
+# Pick ONE topic: movies, sports, cooking, travel, technology
+# Each document should be 150-200 words
+# IMPORTANT: The quality of your documents affects answer quality!
+# (A tuple of plain text is stored ready-made inside the program, so reruns don't rebuild it -
+#  and nobody can change it by accident)
+MY_DOCUMENTS = (
+    """This document is about space exploration and recent developments in space science. One major effort is NASA’s Artemis program, which is preparing to return humans to the Moon for the first time since Apollo. Artemis I (2022) was an uncrewed lunar orbital test, and Artemis II will carry astronauts around the Moon (now slated for 2026). The subsequent Artemis III intends to land astronauts on the lunar surface – the first human moon landing since 1972. In parallel, private companies are playing a big role: SpaceX, for example, is developing its Starship rocket to serve as the lunar lander for Artemis and advance reusable launch technology. Another leap in space science has come from the James Webb Space Telescope (JWST). Since becoming operational in 2022, JWST has peered deeper into the cosmos than ever before. It discovered galaxies dating to just 300–500 million years after the Big Bang – one galaxy formed only around 320 million years post-Big Bang – revealing that massive galaxies and stars appeared earlier than expected. On Mars, NASA’s Perseverance rover (landed 2021) is exploring an ancient lakebed and caching samples for a future return mission. These advances, from Moon missions to powerful space telescopes, mark a new era of cosmic discovery.""",
+
+    """This document is about climate change and the environment, focusing on current trends and actions. Global warming continues to accelerate: 2024 was confirmed as the hottest year on record, with global temperature about 1.55 °C above the pre-industrial average. Such record warmth is not an outlier – it follows a string of extremely hot years and is pushing the world beyond the aspirational 1.5°C limit. The impacts of this warming are increasingly evident. Every additional fraction of a degree is driving more frequent and intense heatwaves, droughts, heavy rainfall, and rising sea levels as ice sheets and glaciers melt. In 2023, many regions saw unprecedented heat and wildfires, while others experienced severe floods – highlighting the urgent need for action. The global response has been centered on international agreements. Under the 2015 Paris Agreement, countries pledged to limit warming to 1.5–2°C by cutting greenhouse emissions. However, current policies are still falling short, prompting stronger calls at recent summits. At COP28 in 2023, nearly 200 nations agreed to signal the beginning of the end of the fossil fuel era and accelerate the transition to clean energy. The outcome urged a roughly 43% cut in global emissions by 2030 and tripling of renewable energy capacity.""",
+
+    """This document is about wildlife, biodiversity, and conservation efforts in nature. Earth is currently facing a biodiversity crisis, with human activities driving habitat loss, pollution, and climate shifts that threaten countless species. Scientists warn that we are experiencing the largest mass extinction event since the dinosaur age. A United Nations report estimated that one million species are at risk of extinction, many within the coming decades. Wildlife populations have plummeted globally – for instance, the WWF Living Planet Index has documented large declines in vertebrate populations since 1970. Yet, there are some encouraging signs due to conservation. A notable example is wild tigers: after a century of decline, global tiger numbers have stabilized and even increased by about 40% in the last seven years. This marks the first potential rise in tiger population in decades, credited to improved monitoring and protected areas. Similarly, mountain gorillas and giant pandas have slowly recovered. In late 2022, nearly 200 countries signed a biodiversity pact to protect 30% of Earth’s land and oceans by 2030. In 2023 alone, scientists discovered over 800 new species, reminding us that even as life disappears, nature still holds incredible secrets to uncover and protect.""",
+
+    """This document is about recent scientific discoveries and breakthroughs across various fields. In the last few years, we have witnessed advances that were once science fiction. In energy, scientists achieved a milestone in nuclear fusion. In 2022, the U.S. National Ignition Facility conducted the first fusion experiment that produced more energy than it consumed. This “net energy gain” was repeated with even greater output in 2023 and is a major step toward clean, limitless power. In biotechnology, CRISPR gene-editing technology has led to powerful therapies. In 2023, a gene therapy for sickle-cell anemia called casgevy became the first CRISPR-based treatment nearing full approval, offering a functional cure. In medicine, a new malaria vaccine approved in 2023 showed 75% efficacy, the first to meet the WHO’s benchmark and offering hope to millions of children. Beyond health, scientists are developing blood tests to detect Alzheimer’s early, astronomers are capturing images of black holes and discovering new exoplanets, and AI is helping model complex systems. These innovations demonstrate how science is rapidly evolving, improving health and deepening our understanding of the universe, biology, and energy – laying the groundwork for transformative technologies in the years ahead.""",
+
+    """This document is about the future outlook of science and nature – looking ahead to goals and emerging trends by 2030 and beyond. In space, humanity is preparing for long-term exploration. NASA aims to establish a lunar outpost by the end of the decade and launch astronauts to Mars by the 2030s. Private and international missions are planning advanced telescopes, lunar bases, and tourism infrastructure. Environmentally, urgent climate goals include peaking global emissions by 2025 and cutting them by 43% by 2030. Most countries have committed to net-zero emissions by 2050, which scientists say is essential to stabilizing the climate. Simultaneously, nations are working toward the “30 by 30” goal of protecting 30% of Earth’s land and oceans by 2030 to halt biodiversity loss. Future innovations will be key. Advancements in clean energy, from battery tech to fusion, may transform power systems. Gene therapy and new vaccines could eliminate diseases like HIV and malaria. Artificial intelligence is expected to accelerate discovery in fields from medicine to environmental modeling. Some scientists even believe that by 2050, we may have the technology to detect extraterrestrial life or build self-sustaining, eco-friendly cities. The next decades could redefine science, health, and our place in the cosmos."""
+)
+
+# Little words that don't say what a question is about (ignored when matching sentences)
+STOPWORDS = frozenset("""
+a an and are as at be by can did do does for from has have how i in is it its me
+of on or the their there this to was were what when where which who why will with you
+""".split())
+
+# What we say when the documents don't contain the answer
+NO_ANSWER = "🧠💭 Hmm... I don’t have info on that topic in my science vault just yet. Try asking me something about space, animals, Earth, or amazing discoveries!"
 
+@st.cache_resource
+def get_encoder():
+    """
+    This function loads the model that turns text into embeddings
+    (all-MiniLM-L6-v2: small, fast, and good at matching questions to text)
+    """
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+def split_into_passages(document, max_words=110, overlap_words=25):
+    """
+    This function cuts one long document into short passages of whole sentences
+    - Each passage has at most ~110 words (about 150 tokens for the AI models)
+    - The last sentences of a passage are repeated at the start of the next one (~25 words),
+      so an answer that sits on the border between two passages isn't cut in half
+    Short passages make the search more precise AND give the AI model less text to read
+    """
+    sentences = re.split(r"(?<=[.!?])\s+", document.strip())
+    passages, current, count = [], [], 0
+    for sentence in sentences:
+        words = len(sentence.split())
+        if current and count + words > max_words:
+            passages.append(" ".join(current))
+            # Carry the last few sentences over into the next passage
+            carry, carry_count = [], 0
+            for previous in reversed(current):
+                previous_words = len(previous.split())
+                if carry_count + previous_words > overlap_words:
+                    break
+                carry.insert(0, previous)
+                carry_count += previous_words
+            current, count = carry, carry_count
+        current.append(sentence)
+        count += words
+    if current:
+        passages.append(" ".join(current))
+    return passages
+
+def documents_fingerprint(documents):
+    """
+    This function makes a short "fingerprint" of our documents
+    Changing even one letter in any document gives a completely different fingerprint
+    """
+    return hashlib.sha256("\0".join(documents).encode("utf-8")).hexdigest()[:16]
+
+def load_document_embeddings(documents):
+    """
+    This function gives back the embeddings for our documents
+    The first time, it embeds all documents in ONE batch and saves the result to a .npy file;
+    after that it just loads the file - no AI model needed at all
+    The file name contains a fingerprint of the documents, so changing them makes a new file
+    The numbers are kept as float16 (half-size numbers): half the memory and disk space,
+    and for matching text the tiny rounding makes no real difference
+    """
+    path = CACHE_DIR / f"app1-docs-{documents_fingerprint(documents)}.npy"
+    if path.exists():
+        return np.load(path).astype(np.float16, copy=False)
+    
+    embeddings = get_encoder().encode(
+        documents,
+        batch_size=len(documents),
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    ).astype(np.float16)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, embeddings)
+    return embeddings
+
+@st.cache_resource
 def setup_documents():
     """
-    This function creates our document database
-    NOTE: This runs every time someone uses the app
-    In a real app, you'd want to save this data permanently
+    This function creates our document search index:
+    the documents plus one row of numbers (an embedding) for each of them
+    With only a handful of documents, a plain NumPy table is much faster than a database
+    NOTE: @st.cache_resource means this only runs ONCE per app process -
+    every rerun after that gets the same ready-made index back
+    The embeddings are saved on disk, so after a restart they are just loaded
     """
-    client = chromadb.Client()
-    try:
-        collection = client.get_collection(name="docs")
-    except Exception:
-        collection = client.create_collection(name="docs")
-  
+    # Cut every document into short passages - we search passages, not whole documents
+    passages = [passage for document in MY_DOCUMENTS for passage in split_into_passages(document)]
     
-    # STUDENT TASK: Replace these 5 documents with your own!
-    # Pick ONE topic: movies, sports, cooking, travel, technology
-    # Each document should be 150-200 words
-    # IMPORTANT: The quality of your documents affects answer quality!
+    # The embeddings are worked out once (or loaded from disk) and kept in memory
+    # The passages go into a NumPy array too, so we can pick several out in one step
+    return np.array(passages, dtype=object), load_document_embeddings(passages)
+
+def load_onnx_qa_model():
+    """
+    This function loads the answer-finding model in ONNX Runtime, a fast engine that
+    fuses the model's math steps together and uses every CPU core
+    The first time, the model is converted to ONNX and saved; after that it is just loaded
+    """
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForQuestionAnswering
     
-    my_documents = [
-        """This document is about space exploration and recent developments in space science. One major effort is NASA’s Artemis program, which is preparing to return humans to the Moon for the first time since Apollo. Artemis I (2022) was an uncrewed lunar orbital test, and Artemis II will carry astronauts around the Moon (now slated for 2026). The subsequent Artemis III intends to land astronauts on the lunar surface – the first human moon landing since 1972. In parallel, private companies are playing a big role: SpaceX, for example, is developing its Starship rocket to serve as the lunar lander for Artemis and advance reusable launch technology. Another leap in space science has come from the James Webb Space Telescope (JWST). Since becoming operational in 2022, JWST has peered deeper into the cosmos than ever before. It discovered galaxies dating to just 300–500 million years after the Big Bang – one galaxy formed only around 320 million years post-Big Bang – revealing that massive galaxies and stars appeared earlier than expected. On Mars, NASA’s Perseverance rover (landed 2021) is exploring an ancient lakebed and caching samples for a future return mission. These advances, from Moon missions to powerful space telescopes, mark a new era of cosmic discovery.""",
-        
-        """This document is about climate change and the environment, focusing on current trends and actions. Global warming continues to accelerate: 2024 was confirmed as the hottest year on record, with global temperature about 1.55 °C above the pre-industrial average. Such record warmth is not an outlier – it follows a string of extremely hot years and is pushing the world beyond the aspirational 1.5°C limit. The impacts of this warming are increasingly evident. Every additional fraction of a degree is driving more frequent and intense heatwaves, droughts, heavy rainfall, and rising sea levels as ice sheets and glaciers melt. In 2023, many regions saw unprecedented heat and wildfires, while others experienced severe floods – highlighting the urgent need for action. The global response has been centered on international agreements. Under the 2015 Paris Agreement, countries pledged to limit warming to 1.5–2°C by cutting greenhouse emissions. However, current policies are still falling short, prompting stronger calls at recent summits. At COP28 in 2023, nearly 200 nations agreed to signal the beginning of the end of the fossil fuel era and accelerate the transition to clean energy. The outcome urged a roughly 43% cut in global emissions by 2030 and tripling of renewable energy capacity.""",
-        
-        """This document is about wildlife, biodiversity, and conservation efforts in nature. Earth is currently facing a biodiversity crisis, with human activities driving habitat loss, pollution, and climate shifts that threaten countless species. Scientists warn that we are experiencing the largest mass extinction event since the dinosaur age. A United Nations report estimated that one million species are at risk of extinction, many within the coming decades. Wildlife populations have plummeted globally – for instance, the WWF Living Planet Index has documented large declines in vertebrate populations since 1970. Yet, there are some encouraging signs due to conservation. A notable example is wild tigers: after a century of decline, global tiger numbers have stabilized and even increased by about 40% in the last seven years. This marks the first potential rise in tiger population in decades, credited to improved monitoring and protected areas. Similarly, mountain gorillas and giant pandas have slowly recovered. In late 2022, nearly 200 countries signed a biodiversity pact to protect 30% of Earth’s land and oceans by 2030. In 2023 alone, scientists discovered over 800 new species, reminding us that even as life disappears, nature still holds incredible secrets to uncover and protect.""",
-        
-        """This document is about recent scientific discoveries and breakthroughs across various fields. In the last few years, we have witnessed advances that were once science fiction. In energy, scientists achieved a milestone in nuclear fusion. In 2022, the U.S. National Ignition Facility conducted the first fusion experiment that produced more energy than it consumed. This “net energy gain” was repeated with even greater output in 2023 and is a major step toward clean, limitless power. In biotechnology, CRISPR gene-editing technology has led to powerful therapies. In 2023, a gene therapy for sickle-cell anemia called casgevy became the first CRISPR-based treatment nearing full approval, offering a functional cure. In medicine, a new malaria vaccine approved in 2023 showed 75% efficacy, the first to meet the WHO’s benchmark and offering hope to millions of children. Beyond health, scientists are developing blood tests to detect Alzheimer’s early, astronomers are capturing images of black holes and discovering new exoplanets, and AI is helping model complex systems. These innovations demonstrate how science is rapidly evolving, improving health and deepening our understanding of the universe, biology, and energy – laying the groundwork for transformative technologies in the years ahead.""",
-        
-        """This document is about the future outlook of science and nature – looking ahead to goals and emerging trends by 2030 and beyond. In space, humanity is preparing for long-term exploration. NASA aims to establish a lunar outpost by the end of the decade and launch astronauts to Mars by the 2030s. Private and international missions are planning advanced telescopes, lunar bases, and tourism infrastructure. Environmentally, urgent climate goals include peaking global emissions by 2025 and cutting them by 43% by 2030. Most countries have committed to net-zero emissions by 2050, which scientists say is essential to stabilizing the climate. Simultaneously, nations are working toward the “30 by 30” goal of protecting 30% of Earth’s land and oceans by 2030 to halt biodiversity loss. Future innovations will be key. Advancements in clean energy, from battery tech to fusion, may transform power systems. Gene therapy and new vaccines could eliminate diseases like HIV and malaria. Artificial intelligence is expected to accelerate discovery in fields from medicine to environmental modeling. Some scientists even believe that by 2050, we may have the technology to detect extraterrestrial life or build self-sustaining, eco-friendly cities. The next decades could redefine science, health, and our place in the cosmos."""
-    ]
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = os.cpu_count() or 1
     
-    # Add documents to database with unique IDs
-    # ChromaDB needs unique identifiers for each document
-    collection.add(
-        documents=my_documents,
-        ids=["doc1", "doc2", "doc3", "doc4", "doc5"]
+    if QA_ONNX_DIR.exists():
+        return ORTModelForQuestionAnswering.from_pretrained(
+            QA_ONNX_DIR, provider="CPUExecutionProvider", session_options=options
+        )
+    model = ORTModelForQuestionAnswering.from_pretrained(
+        QA_MODEL_NAME, export=True, provider="CPUExecutionProvider", session_options=options
     )
+    model.save_pretrained(QA_ONNX_DIR)
+    return model
+
+@st.cache_resource
+def get_qa_model():
+    """
+    This function loads the AI model that finds our answers (and its tokenizer)
+    It is an "extractive" model: instead of writing new text, it points at the exact
+    words in our documents that answer the question - so it can't make things up
+    NOTE: @st.cache_resource means the model is only loaded ONCE per app process
+    We try the fastest way first and fall back step by step:
+    1. ONNX Runtime (fast engine)
+    2. The normal model with its Linear layers shrunk to int8 numbers (~2x faster on a CPU)
+    3. The normal model
+    """
+    tokenizer = AutoTokenizer.from_pretrained(QA_MODEL_NAME)
+    try:
+        return load_onnx_qa_model(), tokenizer
+    except Exception as e:
+        print(f"ONNX Runtime unavailable, using PyTorch: {e}")
     
-    return collection
+    model = AutoModelForQuestionAnswering.from_pretrained(QA_MODEL_NAME)
+    try:
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception:
+        pass
+    return model, tokenizer
 
-def get_answer(collection, question):
+def find_answer_span(question, context, max_answer_tokens=30):
     """
-    This function searches documents and generates answers while minimizing hallucination
+    This function asks the AI model where in the context the answer starts and ends
+    We talk to the model directly (no pipeline in between):
+    one tokenizer call -> one model run -> cut the answer out of the context
+    A context longer than the model can read is cut into overlapping windows,
+    all windows are read in ONE batch, and the best answer from any window wins
+    
+    What it gives back:
+    - The answer text, copied exactly from the context
+    - A score: how sure the model is (0 = guessing, 1 = certain)
     """
+    model, tokenizer = get_qa_model()
+    inputs = tokenizer(
+        question, context,
+        truncation="only_second",      # If it's too long, split the context - never the question
+        max_length=512,                # The most text the model can read at once
+        stride=128,                    # Windows overlap by 128 tokens, so no answer is cut in half
+        return_overflowing_tokens=True,  # Give back EVERY window, not just the first one
+        return_offsets_mapping=True,   # Where each token sits in the context (to copy the answer out)
+        padding=True,                  # Make all windows the same length so they fit in one batch
+        return_tensors="pt"
+    )
+    offsets = inputs.pop("offset_mapping").tolist()
+    inputs.pop("overflow_to_sample_mapping", None)  # The model doesn't expect this one
+    # Only tokens from the context may be part of the answer (not the question or padding)
+    in_context = torch.tensor([
+        [sequence == 1 for sequence in inputs.sequence_ids(window)]
+        for window in range(len(offsets))
+    ])
+    
+    # inference_mode: we only read the model, so PyTorch can skip all its learning bookkeeping
+    with torch.inference_mode():
+        outputs = model(**inputs)
+    
+    # How likely each token is to be the first / last word of the answer
+    # (each row is one window)
+    start = outputs.start_logits.masked_fill(~in_context, float("-inf")).softmax(-1)
+    end = outputs.end_logits.masked_fill(~in_context, float("-inf")).softmax(-1)
     
-    # STEP 1: Search for relevant documents in the database
+    # Score every (start, end) pair in every window at once, keeping only answers that
+    # end after they start and are at most max_answer_tokens long
+    pair_scores = (start[:, :, None] * end[:, None, :]).triu().tril(max_answer_tokens - 1)
+    length = pair_scores.shape[-1]
+    best_window, best_pair = divmod(int(pair_scores.argmax()), length * length)
+    best_start, best_end = divmod(best_pair, length)
+    
+    window_offsets = offsets[best_window]
+    answer = context[window_offsets[best_start][0]:window_offsets[best_end][1]]
+    return answer, float(pair_scores[best_window, best_start, best_end])
+
+def search_documents(index, encoder, question, k=3):
+    """
+    This function finds the k (normally 3) documents that best match a question
+    """
+    # STEP 1: Search for relevant documents
     # We get 3 documents instead of 2 for better context coverage
-    results = collection.query(
-        query_texts=[question],    # The user's question
-        n_results=3               # Get 3 most similar documents
-    )
+    # The question must be embedded with the same encoder as the documents
+    documents, embeddings = index
+    question_embedding = encoder.encode([question], normalize_embeddings=True)[0]
+    
+    # Every embedding has length 1, so one multiplication scores ALL documents at once
+    # (score = cosine similarity: 1 = same meaning, 0 = unrelated)
+    # NumPy turns the float16 table into normal float32 numbers for the math by itself
+    scores = embeddings @ question_embedding
+    k = min(k, len(documents))
+    top = np.argpartition(-scores, k - 1)[:k]   # The k best, in any order
+    top = top[np.argsort(-scores[top])]         # ...sorted best first
     
     # STEP 2: Extract search results
     # docs = the actual document text content
     # distances = how similar each document is to the question (lower = more similar)
-    docs = results["documents"][0]
-    distances = results["distances"][0]
-    
-    # STEP 3: Check if documents are actually relevant to the question
-    # If no documents found OR all documents are too different from question
-    # Return early to avoid hallucination
-    if not docs or min(distances) > 1.5:  # 1.5 is similarity threshold - adjust as needed
-        return "🧠💭 Hmm... I don’t have info on that topic in my science vault just yet. Try asking me something about space, animals, Earth, or amazing discoveries!"
-    
-    # STEP 4: Create structured context for the AI model
-    # Format each document clearly with labels
-    # This helps the AI understand document boundaries
-    context = "\n\n".join([f"Document {i+1}: {doc}" for i, doc in enumerate(docs)])
-    
-    # STEP 5: Build improved prompt to reduce hallucination
-    # Key changes from original:
-    # - Separate context from instructions
-    # - More explicit instructions about staying within context
-    # - Clear format structure
-    prompt = f"""Context information:
-{context}
+    # (2 - 2 x score is the squared distance between the embeddings, so our thresholds still fit)
+    docs = documents[top]
+    distances = 2 - 2 * scores[top]
+    return docs, distances
 
-Question: {question}
+@st.cache_data(ttl=300, max_entries=1024, show_spinner=False)
+def retrieve(_index, question, k=3):
+    """
+    This function remembers search results for 5 minutes, shared by everyone using the app
+    Two people asking the same question share one search (and one question embedding)
+    (The _ in _index tells Streamlit not to use the index as part of the key)
+    """
+    return search_documents(_index, get_encoder(), question, k)
 
-Instructions: Answer ONLY using the information provided above. If the answer is not in the context, respond with "I don't know." Do not add information from outside the context.
+def best_matching_sentence(question, passage):
+    """
+    This function picks the sentence of a passage that shares the most words with the question
+    (Little words like "the" or "is" don't count - they are in almost every sentence)
+    """
+    question_words = set(re.findall(r"\w+", question.lower())) - STOPWORDS
+    sentences = re.split(r"(?<=[.!?])\s+", passage.strip())
+    return max(sentences, key=lambda sentence: len(question_words & set(re.findall(r"\w+", sentence.lower()))))
 
-Answer:"""
+def get_answer(index, question):
+    """
+    This function searches documents and finds answers while minimizing hallucination
+    """
+    docs, distances = retrieve(index, question)
     
-    # STEP 6: Generate answer with anti-hallucination parameters
-    ai_model = pipeline("text2text-generation", model="google/flan-t5-small")
-    response = ai_model(
-        prompt, 
-        max_length=150
-    )
+    # STEP 3: Check if documents are actually relevant to the question
+    # relevant = True/False for every document, worked out in one step
+    # If no document is close enough to the question, return early to avoid hallucination
+    relevant = distances <= 1.5  # 1.5 is similarity threshold - adjust as needed
+    if not relevant.any():
+        return NO_ANSWER
     
-    # STEP 7: Extract and clean the generated answer
-    answer = response[0]['generated_text'].strip()
+    # If the best document matches the question almost perfectly, the answer is
+    # simply its best matching sentence - no need to run the AI model at all
+    if distances[0] < 0.3:  # Results come closest-first
+        return best_matching_sentence(question, docs[0])
     
-
+    # STEP 4: Put the documents together as the text the AI model reads
+    # If the best document is a really close match, read only that one:
+    # the model reads long text in slices, so 1 document instead of 3 is about 3x less work
+    # Otherwise read only the documents that passed the relevance check
+    if distances[0] < 0.8:  # Results come closest-first
+        docs = docs[:1]
+    else:
+        docs = docs[relevant]
+    context = "\n\n".join(docs)
     
-    # STEP 8: Return the final answer
-    return answer
-
-# MAIN APP STARTS HERE - This is where we build the user interface
-
-# STREAMLIT BUILDING BLOCK 1: PAGE TITLE
-# st.title() creates a large heading at the top of your web page
-# The emoji 🤖 makes it more visually appealing
-# This appears as the biggest text on your page
+    # STEP 5: Ask the AI model to find the answer inside the documents
+    answer, score = find_answer_span(question, context)
+    
+    # STEP 6: Only trust answers the model is reasonably sure about
+    # score = how confident the model is (0 = guessing, 1 = certain)
+    if score < 0.1:  # 0.1 is confidence threshold - adjust as needed
+        return NO_ANSWER
+    
+    # STEP 7: Return the final answer
+    return answer.strip()
 
-st.markdown(
+@st.cache_resource
+def get_answer_memory():
     """
-    <div style="display: flex; justify-content: center; margin-bottom: 10px;">
-        <img src="https://i.imgur.com/yFddIhW.png"
-             width="160" style="border-radius: 50%; box-shadow: 0 0 10px rgba(255,255,255,0.4);">
-    </div>
-    """,
-    unsafe_allow_html=True
-)
-
-
-
-st.markdown("<h1 style='text-align: center;'>🧪 ExplAIniac 🪐</h1>", unsafe_allow_html=True)
+    This function gives back ONE shared notebook of answers for the whole app, and its lock
+    (Streamlit runs this file again on every click, so a plain variable would be forgotten -
+    @st.cache_resource keeps the same notebook alive between runs)
+    Every visitor runs in their own thread, so the lock makes sure only one of them
+    reads or changes the notebook at a time
+    """
+    return OrderedDict(), threading.Lock()
 
+def recall_answer(memory, lock, question_key):
+    """
+    This function looks up an answer we gave before (or None if the question is new)
+    Asking the same question again (even with different capitals or spaces)
+    skips both the document search and the AI model - it returns instantly
+    """
+    with lock:
+        if question_key not in memory:
+            return None
+        memory.move_to_end(question_key)  # Recently used answers are kept the longest
+        return memory[question_key]
 
-st.markdown(
-    "<div style='text-align: center; font-size: 27px'>Your AI for Wild Wonders 🧠 & Real Facts🔬</span>",
-    unsafe_allow_html=True
-)
+def remember_answer(memory, lock, question_key, answer):
+    """
+    This function writes an answer into the notebook, keeping only the newest 512
+    """
+    with lock:
+        memory[question_key] = answer
+        memory.move_to_end(question_key)
+        if len(memory) > 512:
+            memory.popitem(last=False)  # Forget the answer that was used longest ago
 
-st.markdown(
+def normalize_question(question):
     """
-    <style>
-    .stApp {
-        background-image: url("https://c4.wallpaperflare.com/wallpaper/816/251/630/space-universe-planets-dark-background-stars-uncountable-abstract-wallpaper-preview.jpg");
-        background-size: cover;
-        background-position: center;
-        background-attachment: fixed;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+    This function tidies up a question so small differences don't count as a new question
+    "  What is DNA? " and "what is  dna?" both become "what is dna?"
+    """
+    return " ".join(question.lower().split())
+
+# MAIN APP STARTS HERE - This is where we build the user interface
 
+# STREAMLIT BUILDING BLOCK 1: PAGE TITLE
+# The logo, title, subtitle, background and welcome text never change,
+# so they are written ONCE here as a single block of HTML
+# and put on the page with ONE st.markdown() call (instead of five)
+HEADER_HTML = """
+<style>
+.stApp {
+    background-image: url("https://c4.wallpaperflare.com/wallpaper/816/251/630/space-universe-planets-dark-background-stars-uncountable-abstract-wallpaper-preview.jpg");
+    background-size: cover;
+    background-position: center;
+    background-attachment: fixed;
+}
+</style>
+<div style="display: flex; justify-content: center; margin-bottom: 10px;">
+    <img src="https://i.imgur.com/yFddIhW.png"
+         width="160" style="border-radius: 50%; box-shadow: 0 0 10px rgba(255,255,255,0.4);">
+</div>
+<h1 style='text-align: center;'>🧪 ExplAIniac 🪐</h1>
+<div style='text-align: center; font-size: 27px; margin-bottom: 1rem'>Your AI for Wild Wonders 🧠 & Real Facts🔬</div>
+<div style='text-align: center; font-size: 25px'>
+Welcome to my personal science & nature vault!🦉 Ask me anything about space 🚀, animals 🐘, discoveries 💡, and the wonders of our world🌿... From the smallest DNA 🧬 to the farthest galaxy🌌 — ask away!
+</div>
+"""
 
 # STREAMLIT BUILDING BLOCK 2: DESCRIPTIVE TEXT  
-# st.write() displays regular text on the page
+# st.markdown() with unsafe_allow_html=True shows our own HTML on the page
 # Use this for instructions, descriptions, or any text content
-# It automatically formats the text nicely
-st.markdown(
-    """
-    <div style='text-align: center; font-size: 25px'>
-    Welcome to my personal science & nature vault!🦉 Ask me anything about space 🚀, animals 🐘, discoveries 💡, and the wonders of our world🌿... From the smallest DNA 🧬 to the farthest galaxy🌌 — ask away!
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 # STREAMLIT BUILDING BLOCK 3: FUNCTION CALLS
-# We call our function to set up the document database
-# This happens every time someone uses the app
-collection = setup_documents()
+# We call our function to set up the document search index
+# Thanks to caching, the documents are only embedded the first time
+index = setup_documents()
 
 # STREAMLIT BUILDING BLOCK 4: TEXT INPUT BOX
 # st.text_input() creates a box where users can type
@@ -179,22 +401,24 @@ collection = setup_documents()
 # - Users can click in this box and type their question
 # Custom-styled label
 
-st.markdown("<br>", unsafe_allow_html=True)
-
 st.markdown(
-    "<span style='font-size:21px; color:magenta;'>🔍 What mystery of the universe (or your backyard) can ExplAIniac solve today?</span>",
+    "<br><span style='font-size:21px; color:magenta;'>🔍 What mystery of the universe (or your backyard) can ExplAIniac solve today?</span>",
     unsafe_allow_html=True
 )
 
-# Text input box with no visible label
-question = st.text_input(label="")
-
-# STREAMLIT BUILDING BLOCK 5: BUTTON
-# st.button() creates a clickable button
-# - When clicked, all code inside the 'if' block runs
+# STREAMLIT BUILDING BLOCK 5: FORM WITH A BUTTON
+# st.form() groups the text box and the button together
+# - Streamlit normally reruns the whole app whenever a widget changes;
+#   inside a form, nothing reruns until the button is clicked (or Enter is pressed)
+# - st.form_submit_button() is the form's button - it sends everything at once
 # - type="primary" makes the button blue and prominent
-# - The button text appears on the button itself
-if st.button("**Reveal the Wonders! 🌟**", type="primary"):
+with st.form("qa", clear_on_submit=False, border=False):
+    # Text input box with no visible label
+    question = st.text_input(label="")
+    submitted = st.form_submit_button("**Reveal the Wonders! 🌟**", type="primary")
+
+# When the form was sent, all code inside the 'if' block runs
+if submitted:
     
     # STREAMLIT BUILDING BLOCK 6: CONDITIONAL LOGIC
     # Check if user actually typed something (not empty)
@@ -206,7 +430,12 @@ if st.button("**Reveal the Wonders! 🌟**", type="primary"):
         # - Everything inside the 'with' block runs while spinner shows
         # - Spinner disappears when the code finishes
         with st.spinner("Launching satellites, scanning DNA strands, and decoding nature’s secrets..."):
-            answer = get_answer(collection, question)
+            question_key = normalize_question(question)
+            memory, memory_lock = get_answer_memory()
+            answer = recall_answer(memory, memory_lock, question_key)
+            if answer is None:
+                answer = get_answer(index, question)  # The model is case-sensitive, so it gets the question as typed
+                remember_answer(memory, memory_lock, question_key, answer)
         
         # STREAMLIT BUILDING BLOCK 8: FORMATTED TEXT OUTPUT
         # st.write() can display different types of content
@@ -0,0 +1,44 @@
+# 🎨 Shared styles for all our Streamlit apps
+# Every app's look lives in static/*.css; this file reads those files and puts them on the page.
+# Python only runs an imported module ONCE per process, so the CSS files are read from disk
+# one time - every Streamlit rerun after that just sends the ready-made string.
+# (Streamlit serves .css files from static/ as plain text, so browsers won't load them with a <link>.)
+
+from functools import lru_cache  # Remembers a function's answer so we only work it out once
+from pathlib import Path         # Helps us work with file paths (like addresses for files)
+
+import streamlit as st           # Makes beautiful web apps (like the one you're using!)
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+
+@lru_cache(maxsize=None)
+def load_stylesheet(*names: str) -> str:
+    """
+    📖🎨 THE STYLE BOOK READER!
+
+    What this function does (in simple words):
+    - Reads one or more CSS files from the static/ folder
+    - Glues them together into ONE <style> block (later files win when rules clash)
+    - Remembers the result, so each file is only read from disk once
+
+    What it expects:
+    - names: The CSS file names, like "shared.css", "finalapp.css"
+
+    What it gives back:
+    - A "<style>...</style>" string ready for st.markdown
+    """
+    css = "\n".join((STATIC_DIR / name).read_text(encoding="utf-8") for name in names)
+    return "<style>\n" + css + "</style>"
+
+
+def inject_styles(*names: str) -> None:
+    """
+    🖌️ THE PAGE PAINTER!
+
+    What this function does (in simple words):
+    - Puts our CSS on the page with ONE st.markdown call
+    - Call it on every rerun: Streamlit rebuilds the page each time, so styles
+      that aren't sent again would disappear
+    """
+    st.markdown(load_stylesheet(*names), unsafe_allow_html=True)